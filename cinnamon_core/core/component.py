@@ -36,12 +36,10 @@ class Component:
     ):
         if item == 'config':
             raise AttributeError()
-        if item in self.__dict__:
-            return super().__getattr__(item)
-        if item in self.config:
-            return self.config[item]
-        else:
+        param = self.config.get(item)
+        if param is None:
             raise AttributeError(f'{self.__class__.__name__} has no attribute {item}')
+        return param.value
 
     def __setattr__(
             self,
@@ -183,10 +181,11 @@ class Component:
 
         if name in self.config or hasattr(self, name):
             return getattr(self, name)
-        else:
-            children = [param.value for param_key, param in self.config.items() if isinstance(param.value, Component)]
-            for child in children:
-                child_find = child.find(name=name)
+
+        # Children are visited lazily: the search stops at the first match
+        for param in self.config.values():
+            if isinstance(param.value, Component):
+                child_find = param.value.find(name=name)
                 if child_find is not None:
                     return child_find
 
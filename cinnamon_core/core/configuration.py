@@ -1,22 +1,94 @@
 from __future__ import annotations
 
 import inspect
+import logging
 import os
 from copy import deepcopy
-from functools import partial
-from typing import Dict, Any, Callable, Optional, TypeVar, Hashable, Type, Iterable, List, Set
-
-from typeguard import check_type
+from typing import Dict, Any, Callable, Optional, TypeVar, Hashable, Type, Iterable, List, Set, Tuple
 
 from cinnamon_core import core
-from cinnamon_core.core.data import FieldDict, Parameter, ValidationFailureException, ValidationResult, F
+from cinnamon_core.core.data import FieldDict, Parameter, ValidationFailureException, ValidationResult, F, \
+    TypingCondition
 from cinnamon_core.utility import logging_utility
-from cinnamon_core.utility.python_utility import get_dict_values_combinations
+from cinnamon_core.utility.python_utility import get_dict_values_combinations, iterate_dict_values_combinations
 
 C = TypeVar('C', bound='Configuration')
 Constructor = Callable[[Any], C]
 
 
+class ParameterTypingCondition(TypingCondition):
+    """
+    A condition that checks if the value of the specified ``Parameter`` matches the given type hint annotation.
+    Class values are checked via ``issubclass``, while other values are checked as in ``TypingCondition``.
+    """
+
+    __slots__ = ()
+
+    def check_value(
+            self,
+            value: Any
+    ) -> bool:
+        if inspect.isclass(value):
+            try:
+                return issubclass(value, self.type_hint)
+            except TypeError:
+                return False
+
+        return super().check_value(value)
+
+
+class RequiredCondition:
+    """
+    A condition that checks if the value of the specified ``Parameter`` is not None.
+    """
+
+    __slots__ = ('param_name', '__weakref__')
+
+    def __init__(
+            self,
+            param_name: Hashable
+    ):
+        """
+        The ``RequiredCondition`` constructor.
+
+        Args:
+            param_name: unique identifier of the ``Parameter`` instance
+        """
+        self.param_name = param_name
+
+    def __call__(
+            self,
+            parameters: Configuration
+    ) -> bool:
+        return parameters.get(self.param_name).value is not None
+
+
+class VariantsCondition:
+    """
+    A condition that checks if the specified ``Parameter`` has at least one variant.
+    """
+
+    __slots__ = ('param_name', '__weakref__')
+
+    def __init__(
+            self,
+            param_name: Hashable
+    ):
+        """
+        The ``VariantsCondition`` constructor.
+
+        Args:
+            param_name: unique identifier of the ``Parameter`` instance
+        """
+        self.param_name = param_name
+
+    def __call__(
+            self,
+            parameters: Configuration
+    ) -> bool:
+        return len(parameters.get(self.param_name).variants) > 0
+
+
 class Configuration(FieldDict):
     """
     Generic Configuration class.
@@ -30,6 +102,15 @@ class Configuration(FieldDict):
             self,
             **kwargs
     ):
+        # Conditions partitioned by stage (see ``_get_condition_partitions()``), along with the conditions
+        # dictionary and its version they were computed from
+        self.__dict__['_condition_partitions'] = None
+        # Child parameters, updated whenever a ``Parameter`` is set or deleted.
+        # All child parameters (including calibration ones) are built by post_build(), while ``children``
+        # excludes calibration ones.
+        self.__dict__['_child_params'] = {}
+        self.__dict__['_children'] = {}
+
         super().__init__(**kwargs)
         self.add(name='built',
                  value=False,
@@ -44,19 +125,50 @@ class Configuration(FieldDict):
     ):
         if isinstance(item, Parameter):
             super().__setitem__(key, item)
+            self._index_child(key=key, param=item)
+            param = item
         else:
-            if key not in self:
+            param = self.get(key)
+            if param is None:
                 raise KeyError(f'Cannot update the value of a non-existing parameter! Key = {key}')
-            self.get(key).value = item
-        self.get(key).in_allowed_range()
+            param.value = item
+        param.in_allowed_range()
+
+    def __delitem__(
+            self,
+            key: Hashable
+    ):
+        super().__delitem__(key)
+        self._child_params.pop(key, None)
+        self._children.pop(key, None)
+
+    def _index_child(
+            self,
+            key: Hashable,
+            param: Parameter
+    ):
+        if param.is_child:
+            self._child_params[key] = param
+        else:
+            self._child_params.pop(key, None)
+
+        if param.is_child and not param.is_calibration:
+            self._children[key] = param
+        else:
+            self._children.pop(key, None)
 
     @property
     def children(
             self
     ) -> Dict[str, F]:
-        return {param_key: param
-                for param_key, param in self.items()
-                if param.is_child and not param.is_calibration}
+        """
+        The child ``Parameter`` (i.e., ``is_child=True``) of the ``Configuration``, excluding calibration ones.
+        The returned dictionary is maintained by the ``Configuration`` and should not be modified.
+
+        Returns:
+            A dictionary with ``Parameter.name`` as keys and ``Parameter`` as values
+        """
+        return self._children
 
     def add(
             self,
@@ -110,45 +222,32 @@ class Configuration(FieldDict):
         # is_required condition
         if is_required:
             self.add_condition(name=f'{name}_is_required',
-                               condition=lambda p: p[name] is not None)
-
-        def typing_condition(
-                parameters: Configuration,
-                param_name: Hashable,
-                type_hint: Type
-        ) -> bool:
-            found_param = parameters.get(param_name)
-            try:
-                if inspect.isclass(found_param.value):
-                    return issubclass(found_param.value, type_hint)
-                else:
-                    check_type(argname=str(found_param.name),
-                               value=found_param.value,
-                               expected_type=type_hint)
-            except TypeError:
-                return False
-            return True
+                               condition=RequiredCondition(param_name=name))
 
         # add type_hint condition
-        if type_hint is not None and not is_calibration:
-            self.add_condition(name=f'{name}_typecheck' if not is_child else f'pre_{name}_typecheck',
-                               condition=lambda parameters: partial(typing_condition,
-                                                                    param_name=name,
-                                                                    type_hint=type_hint)(parameters))
+        # Conditions are updated in case the Parameter is re-added (e.g., with a different type_hint)
+        type_hint = type_hint if not is_calibration else None
+        self._set_typing_condition(condition_name=f'{name}_typecheck',
+                                   field_name=name,
+                                   type_hint=type_hint if not is_child else None,
+                                   condition_type=ParameterTypingCondition)
+        self._set_typing_condition(condition_name=f'pre_{name}_typecheck',
+                                   field_name=name,
+                                   type_hint=type_hint if is_child else None,
+                                   condition_type=ParameterTypingCondition)
 
         # add post-build condition if the parameter is registration and should be built
-        if is_child and build_from_registration and build_type_hint is not None:
-            self.add_condition(name=f'post_{name}_build_typecheck',
-                               condition=lambda parameters: partial(typing_condition,
-                                                                    param_name=name,
-                                                                    type_hint=build_type_hint)(parameters))
+        self._set_typing_condition(condition_name=f'post_{name}_build_typecheck',
+                                   field_name=name,
+                                   type_hint=build_type_hint if is_child and build_from_registration else None,
+                                   condition_type=ParameterTypingCondition)
 
         # add variants condition
         # we do not consider allowed_range for variants since we have a lazy condition in __setitem__
         # However, variants space is usually small -> we might consider adding a pre-condition here
         if variants is not None:
             self.add_condition(name=f'{name}_valid_variants',
-                               condition=lambda p: len(p.get(name).variants) > 0)
+                               condition=VariantsCondition(param_name=name))
 
     def get_variants_combinations(
             self,
@@ -173,12 +272,54 @@ class Configuration(FieldDict):
         for param_key, param in self.items():
             if param.variants is not None and len(param.variants):
                 parameters[param_key] = param.variants
-        combinations = get_dict_values_combinations(params_dict=parameters)
-        if validate:
-            return [comb for comb in combinations
-                    if self.get_delta_copy(params=comb).fully_validate(strict=False).passed]
-        else:
-            return combinations
+
+        if not validate:
+            return get_dict_values_combinations(params_dict=parameters)
+
+        parameters = self._prune_variants(parameters=parameters)
+        return [comb for comb in iterate_dict_values_combinations(params_dict=parameters)
+                if self.get_delta_copy(params=comb).fully_validate(strict=False).passed]
+
+    def _prune_variants(
+            self,
+            parameters: Dict[str, Iterable]
+    ) -> Dict[str, List]:
+        """
+        Discards variant values that do not satisfy their own ``Parameter`` conditions (i.e., ``is_required``
+        and type checking). Any combination containing such values would not pass validation.
+        Conditions are evaluated by temporarily setting each variant value in place.
+
+        Args:
+            parameters: a dictionary with ``Parameter.name`` as keys and ``Parameter.variants`` as values
+
+        Returns:
+            A dictionary with ``Parameter.name`` as keys and the valid subset of ``Parameter.variants`` as values
+        """
+        conditions = self.conditions if 'conditions' in self else {}
+
+        pruned_parameters = {}
+        for param_key, variants in parameters.items():
+            param = self.get(param_key)
+            param_conditions = [conditions[condition_name]
+                                for condition_name in [f'{param_key}_is_required', f'{param_key}_typecheck']
+                                if condition_name in conditions]
+            if param.is_child or not param_conditions:
+                pruned_parameters[param_key] = variants
+                continue
+
+            original_value = param.value
+            try:
+                pruned_variants = []
+                for variant in variants:
+                    param.value = variant
+                    if all(condition(self) for condition in param_conditions):
+                        pruned_variants.append(variant)
+            finally:
+                param.value = original_value
+
+            pruned_parameters[param_key] = pruned_variants
+
+        return pruned_parameters
 
     def get_serialization_parameters(
             self
@@ -192,12 +333,15 @@ class Configuration(FieldDict):
         """
         return {key: param for key, param in self.items() if param.affects_serialization}
 
-    def validate(
+    def _validate_conditions(
             self,
             strict: bool = True
     ) -> ValidationResult:
         """
         Calls all stage-related conditions to assess the correctness of the current ``Configuration``.
+        Conditions starting with ``pre`` are skipped if the ``Configuration`` is built, while conditions
+        starting with ``post`` are skipped if it is not.
+        Required parameters are checked first to avoid running (more expensive) conditions on missing values.
 
         Args:
             strict: if True, a failed validation process will raise ``InvalidConfigurationException``
@@ -210,21 +354,77 @@ class Configuration(FieldDict):
             ``ValidationFailureException``: if ``strict = True`` and the validation process failed
         """
 
-        for key, value in self.items():
-            if isinstance(key, FieldDict):
-                key_validation = key.validate(strict=strict)
-                if not key_validation.passed:
-                    return key_validation
+        required_conditions, pre_conditions, post_conditions = self._get_condition_partitions()
+        validation_result = self._evaluate_conditions(conditions=required_conditions,
+                                                      strict=strict)
+        if not validation_result.passed:
+            return validation_result
 
-        if 'conditions' not in self:
-            return ValidationResult(passed=True)
+        stage_conditions = post_conditions if self.built else pre_conditions
+        return self._evaluate_conditions(conditions=stage_conditions,
+                                         strict=strict)
 
-        for condition_name, condition in self.conditions.items():
-            if condition_name.startswith('pre') and self.built:
-                continue
-            if condition_name.startswith('post') and not self.built:
+    def _get_condition_partitions(
+            self
+    ) -> Tuple[Dict[str, Callable[[Configuration], bool]], ...]:
+        """
+        Partitions the conditions of the current ``Configuration`` by stage:
+        - required: ``RequiredCondition`` conditions (without ``pre`` or ``post`` prefix), evaluated in all stages
+        - pre: remaining conditions that do not start with ``post``, evaluated before ``post_build()``
+        - post: remaining conditions that do not start with ``pre``, evaluated after ``post_build()``
+
+        Partitions are derived from ``conditions`` and computed again whenever ``conditions`` is modified,
+        including direct updates (see ``ConditionsDict``).
+
+        Returns:
+            The required, pre-build and post-build conditions.
+        """
+        conditions_field = dict.get(self, 'conditions')
+        conditions = conditions_field.value if conditions_field is not None else {}
+        version = getattr(conditions, 'version', None)
+        cached = self._condition_partitions
+        if cached is not None and cached[0] is conditions and cached[1] == version:
+            return cached[2]
+
+        required_conditions, pre_conditions, post_conditions = {}, {}, {}
+        for condition_name, condition in conditions.items():
+            if isinstance(condition, RequiredCondition) and not condition_name.startswith(('pre', 'post')):
+                required_conditions[condition_name] = condition
                 continue
 
+            if not condition_name.startswith('post'):
+                pre_conditions[condition_name] = condition
+            if not condition_name.startswith('pre'):
+                post_conditions[condition_name] = condition
+
+        partitions = (required_conditions, pre_conditions, post_conditions)
+
+        # Only versioned conditions can be cached: plain dictionaries are partitioned at each call
+        if version is not None:
+            self.__dict__['_condition_partitions'] = (conditions, version, partitions)
+        return partitions
+
+    def _evaluate_conditions(
+            self,
+            conditions: Dict[str, Callable[[Configuration], bool]],
+            strict: bool = True
+    ) -> ValidationResult:
+        """
+        Calls the given conditions on the current ``Configuration``.
+
+        Args:
+            conditions: a dictionary with condition names as keys and conditions as values
+            strict: if True, a failed validation process will raise ``InvalidConfigurationException``
+
+        Returns:
+            A ``ValidationResult`` object that stores the boolean result of the validation process along with
+            an error message if the result is ``False``.
+
+        Raises:
+            ``ValidationFailureException``: if ``strict = True`` and the validation process failed
+        """
+
+        for condition_name, condition in conditions.items():
             if not condition(self):
                 validation_result = ValidationResult(passed=False,
                                                      error_message=f'Condition {condition_name} failed!')
@@ -280,10 +480,9 @@ class Configuration(FieldDict):
         else:
             return
 
-        for param_key, param in self.items():
-            if param.is_child and param.build_from_registration and param.value is not None:
-                if 'conditions' in self and f'{param_key}_typecheck' in self.conditions:
-                    del self.conditions[f'{param_key}_typecheck']
+        for param_key, param in self._child_params.items():
+            if param.build_from_registration and param.value is not None:
+                self.remove_condition(name=f'{param_key}_typecheck')
 
                 if type(param.value) == core.registry.RegistrationKey:
                     param.value = core.registry.Registry.build_component_from_key(registration_key=param.value)
@@ -337,8 +536,9 @@ class Configuration(FieldDict):
         """
         params = params if params is not None else {}
 
-        copy_dict = deepcopy(params)
-        copy = deepcopy(self)
+        # values are deep-copied when assigned (here or in children delta copies)
+        copy_dict = dict(params)
+        copy = self.clone()
 
         found_keys = []
         for key, value in params.items():
@@ -401,7 +601,11 @@ class Configuration(FieldDict):
         Args:
             full: if enabled, each parameter's details are displayed.
         """
-        logging_utility.logger.info(f'Displaying {self.__class__.__name__} parameters...')
+        # Formatting parameters can be expensive (e.g., large values): skip it if it is not going to be logged
+        if not logging_utility.logger.isEnabledFor(logging.INFO):
+            return
+
+        logging_utility.logger.info('Displaying %s parameters...', self.__class__.__name__)
         parameters_repr = os.linesep.join(
             [f'{param_key}: {param}' for param_key, param in self.to_value_dict().items()])
         logging_utility.logger.info(parameters_repr)
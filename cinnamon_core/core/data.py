@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import copyreg
 import os
+import sys
+import weakref
+from copy import deepcopy
 from dataclasses import dataclass
-from functools import partial
-from typing import Any, Optional, Callable, Dict, Type, Set, Union, Iterable, Tuple, Hashable, TypeVar, List
+from functools import partial, lru_cache
+from typing import Any, Optional, Callable, Dict, Type, Set, FrozenSet, Union, Iterable, Tuple, Hashable, TypeVar, List
 
 from typeguard import check_type
 
@@ -47,6 +51,241 @@ class ValidationFailureException(Exception):
                          f'Error message: {validation_result.error_message}')
 
 
+def _intern(
+        value: Hashable
+) -> Hashable:
+    """
+    Interns string values so that tags and condition names are compared by identity in sets and dictionaries.
+
+    Args:
+        value: the value to intern
+
+    Returns:
+        The interned string if ``value`` is a string, ``value`` otherwise.
+    """
+    return sys.intern(value) if type(value) == str else value
+
+
+# Scalar type hints are checked via isinstance (same semantics as ``check_type``, e.g., int values are valid floats)
+_SCALAR_TYPES = {
+    int: int,
+    float: (int, float),
+    str: str,
+    bool: bool
+}
+
+
+def get_scalar_instance_types(
+        type_hint: Type
+) -> Optional[Union[Type, Tuple[Type, ...]]]:
+    """
+    Gets the ``isinstance`` types that are equivalent to ``check_type`` for scalar type hints (e.g., ``int``).
+
+    Args:
+        type_hint: the type hint annotation
+
+    Returns:
+        The type (or tuple of types) to check values against via ``isinstance`` if ``type_hint`` is a scalar type,
+        None otherwise.
+    """
+    return _SCALAR_TYPES.get(type_hint) if type(type_hint) == type else None
+
+
+def _memoize_passed_checks(
+        checker: Callable[[Any], None]
+) -> Callable[[Any], None]:
+    """
+    Wraps a type checker to skip checking callable values (e.g., conditions) that already passed the check.
+    Callables are only referenced weakly and their check does not depend on mutable content.
+    All other values are always checked since they can be modified in place.
+
+    Args:
+        checker: the type checker to wrap
+
+    Returns:
+        The wrapped type checker.
+    """
+
+    # id(value) -> weak reference to value: stale entries are removed when the value is garbage collected
+    passed = {}
+
+    def check(value: Any):
+        if not callable(value):
+            checker(value)
+            return
+
+        value_id = id(value)
+        value_ref = passed.get(value_id)
+        if value_ref is not None and value_ref() is value:
+            return
+
+        checker(value)
+        try:
+            passed[value_id] = weakref.ref(value,
+                                           lambda ref: passed.pop(value_id) if passed.get(value_id) is ref else None)
+        except TypeError:
+            # not weakly referenceable
+            pass
+
+    return check
+
+
+def _is_plain_class(
+        type_hint: Type
+) -> bool:
+    """
+    Checks if ``check_type`` on ``type_hint`` amounts to an ``isinstance`` check.
+
+    Args:
+        type_hint: the type hint annotation
+
+    Returns:
+        True if ``type_hint`` is a plain (non-generic, non-tuple) class.
+    """
+    return type(type_hint) == type \
+        and getattr(type_hint, '__origin__', None) is None \
+        and not issubclass(type_hint, tuple)
+
+
+@lru_cache(maxsize=None)
+def _compiled_checker(
+        type_hint: Type
+) -> Callable[[Any], None]:
+    type_check = partial(check_type, '', expected_type=type_hint)
+
+    # Values that are not instances of the type hint are still checked via ``check_type`` (e.g., mocks are valid)
+    instance_types = get_scalar_instance_types(type_hint=type_hint)
+    if instance_types is None and _is_plain_class(type_hint=type_hint):
+        instance_types = type_hint
+    if instance_types is not None:
+        def check(value: Any):
+            if not isinstance(value, instance_types):
+                type_check(value)
+
+        return check
+
+    # Dictionaries are checked item by item so that items can be memoized (e.g., conditions)
+    type_args = getattr(type_hint, '__args__', None)
+    if getattr(type_hint, '__origin__', None) is dict \
+            and type_args is not None and len(type_args) == 2 \
+            and not getattr(type_hint, '__parameters__', None) \
+            and type_args != (Any, Any):
+        check_key = compile_type_checker(type_hint=type_args[0])
+        check_value = compile_type_checker(type_hint=type_args[1])
+
+        def check(value: Any):
+            if not isinstance(value, dict):
+                type_check(value)
+                return
+            for dict_key, dict_value in value.items():
+                check_key(dict_key)
+                check_value(dict_value)
+
+        return check
+
+    return _memoize_passed_checks(checker=type_check)
+
+
+def compile_type_checker(
+        type_hint: Type
+) -> Callable[[Any], None]:
+    """
+    Returns a (cached) type checker for the given type hint annotation.
+    The returned callable receives a value and raises ``TypeError`` if the value does not match ``type_hint``.
+
+    Args:
+        type_hint: the type hint annotation to check values against
+
+    Returns:
+        A callable that type checks an input value.
+    """
+    try:
+        return _compiled_checker(type_hint)
+    except TypeError:
+        # unhashable type hints cannot be cached
+        return partial(check_type, '', expected_type=type_hint)
+
+
+class TypingCondition:
+    """
+    A condition that checks if the value of the specified ``Field`` matches the given type hint annotation.
+    Scalar type hints (e.g., ``int``) are checked via ``isinstance``, while other type hints are checked via
+    ``typeguard.check_type``.
+    Differently from ``lambda`` and nested functions, ``TypingCondition`` instances can be pickled.
+    """
+
+    __slots__ = ('field_name', 'type_hint', '_scalar_types', '_checker', '__weakref__')
+
+    def __init__(
+            self,
+            field_name: Hashable,
+            type_hint: Type
+    ):
+        """
+        The ``TypingCondition`` constructor.
+
+        Args:
+            field_name: unique identifier of the ``Field`` instance
+            type_hint: type annotation concerning ``Field.value``
+        """
+        self.field_name = field_name
+        self.type_hint = type_hint
+        self._scalar_types = get_scalar_instance_types(type_hint=type_hint)
+        self._checker = compile_type_checker(type_hint=type_hint)
+
+    def check_value(
+            self,
+            value: Any
+    ) -> bool:
+        """
+        Checks if the given value matches ``type_hint``.
+
+        Args:
+            value: the value to check
+
+        Returns:
+            True if ``value`` matches ``type_hint``.
+        """
+        if self._scalar_types is not None and isinstance(value, self._scalar_types):
+            return True
+
+        try:
+            self._checker(value)
+        except TypeError:
+            return False
+        return True
+
+    def __call__(
+            self,
+            fields: FieldDict
+    ) -> bool:
+        return self.check_value(fields.get(self.field_name).value)
+
+    def __reduce__(
+            self
+    ):
+        # Type checkers are compiled again when unpickling
+        return self.__class__, (self.field_name, self.type_hint)
+
+
+@lru_cache(maxsize=None)
+def _get_slots(
+        cls: Type
+) -> Tuple[str, ...]:
+    """
+    Gets all the slots declared by ``cls`` and its base classes.
+
+    Args:
+        cls: the class to inspect
+
+    Returns:
+        A tuple of slot names.
+    """
+    return tuple(slot
+                 for base in reversed(cls.__mro__)
+                 for slot in base.__dict__.get('__slots__', ()))
+
+
 class Field:
     """
     A generic field wrapper that allows
@@ -55,6 +294,10 @@ class Field:
     - tags metadata for categorization and general-purpose retrieval
     """
 
+    # ``Field`` instances are created in large numbers (e.g., when copying configurations): slots avoid
+    # a per-instance ``__dict__``
+    __slots__ = ('name', 'value', 'type_hint', 'description', 'tags')
+
     def __init__(
             self,
             name: Hashable,
@@ -77,7 +320,8 @@ class Field:
         self.value = value
         self.type_hint = type_hint
         self.description = description
-        self.tags = tags if tags is not None else set()
+        # Most fields have no tags: skip the interning pass in that case
+        self.tags = {_intern(tag) for tag in tags} if tags else set()
 
     def short_repr(
             self
@@ -106,7 +350,37 @@ class Field:
     def __hash__(
             self
     ) -> int:
-        return hash(str(self))
+        # Equal fields share the same name: hashing the name avoids formatting (potentially large) values
+        return hash(self.name)
+
+    def __deepcopy__(
+            self,
+            memo: Dict
+    ) -> F:
+        return self.clone(memo=memo)
+
+    def clone(
+            self,
+            memo: Optional[Dict] = None
+    ) -> F:
+        """
+        Builds a copy of the ``Field`` where only ``value`` and ``tags`` are copied.
+        All other attributes (e.g., type hints and callables) are shared with the original ``Field``.
+
+        Args:
+            memo: the ``deepcopy`` memo dictionary
+
+        Returns:
+            The ``Field`` copy.
+        """
+        copy = self.__class__.__new__(self.__class__)
+        for attribute in _get_slots(self.__class__):
+            setattr(copy, attribute, getattr(self, attribute))
+        if hasattr(self, '__dict__'):
+            copy.__dict__.update(self.__dict__)
+        copy.tags = set(self.tags)
+        copy.value = deepcopy(self.value, memo)
+        return copy
 
     def __eq__(
             self,
@@ -121,9 +395,74 @@ class Field:
         Returns:
             True if the two ``Field`` instances are equal.
         """
-        name_condition = lambda other: self.name == other.name
-        value_condition = lambda other: self.value == other.value
-        return name_condition(other) and value_condition(other)
+        if self is other:
+            return True
+        return self.name == other.name and self.value == other.value
+
+
+class ConditionsDict(dict):
+    """
+    A Python dictionary extension that stores ``FieldDict`` conditions.
+    ``version`` is increased at each update so that modifications can be cheaply detected (e.g., to invalidate
+    conditions grouped by stage).
+    """
+
+    # Class-level default since pickle restores dictionary items before instance attributes
+    version: int = 0
+
+    def __setitem__(
+            self,
+            key: str,
+            value: Callable[[FieldDict], bool]
+    ):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(
+            self,
+            key: str
+    ):
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(
+            self,
+            key: str,
+            *args
+    ) -> Callable[[FieldDict], bool]:
+        value = super().pop(key, *args)
+        self.version += 1
+        return value
+
+    def popitem(
+            self
+    ) -> Tuple[str, Callable[[FieldDict], bool]]:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(
+            self
+    ):
+        super().clear()
+        self.version += 1
+
+    def update(
+            self,
+            *args,
+            **kwargs
+    ):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(
+            self,
+            key: str,
+            default: Optional[Callable[[FieldDict], bool]] = None
+    ) -> Callable[[FieldDict], bool]:
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
 
 
 class FieldDict(dict):
@@ -137,6 +476,16 @@ class FieldDict(dict):
             *args,
             **kwargs
     ):
+        # tag -> field names inverted index (see ``search_by_tag()``)
+        self.__dict__['_tag_index'] = {}
+        # tags set -> field names index for exact matches (see ``search_by_tag()``)
+        self.__dict__['_exact_tag_index'] = {}
+
+        # Structural version: increased whenever fields or conditions are added or removed.
+        # Used to invalidate cached searches.
+        self.__dict__['_version'] = 0
+        self.__dict__['_search_cache'] = {}
+
         super(FieldDict, self).__init__(*args, **kwargs)
         for arg in args:
             if isinstance(arg, dict):
@@ -151,7 +500,7 @@ class FieldDict(dict):
             self,
             item
     ):
-        field = self.get(item)
+        field = dict.get(self, item)
         if field is None:
             raise AttributeError(f'Could not find attribute {item}')
         return field.value
@@ -173,8 +522,9 @@ class FieldDict(dict):
             self,
             key
     ):
+        self._unindex_field(key=key)
         super().__delitem__(key)
-        del self.__dict__[key]
+        self._mark_modified()
 
     def __setitem__(
             self,
@@ -182,10 +532,63 @@ class FieldDict(dict):
             item: Union[Field, Any]
     ):
         if isinstance(item, Field):
+            key = _intern(key)
+            self._unindex_field(key=key)
             super().__setitem__(key, item)
+            for tag in item.tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            self._exact_tag_index.setdefault(frozenset(item.tags), set()).add(key)
+            self._mark_modified()
         else:
-            assert key in self, f'Cannot find or update a non-existing field! Key = {key}'
-            self.get(key).value = item
+            field = self.get(key)
+            assert field is not None, f'Cannot find or update a non-existing field! Key = {key}'
+            field.value = item
+
+    # Dictionary updates go through ``__setitem__`` and ``__delitem__`` to keep indexes and cached searches in sync
+
+    def pop(
+            self,
+            key: Hashable,
+            *args
+    ) -> F:
+        if key not in self:
+            return super().pop(key, *args)
+
+        field = dict.__getitem__(self, key)
+        del self[key]
+        return field
+
+    def popitem(
+            self
+    ) -> Tuple[Hashable, F]:
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def clear(
+            self
+    ):
+        for key in list(self.keys()):
+            del self[key]
+
+    def update(
+            self,
+            *args,
+            **kwargs
+    ):
+        for key, item in dict(*args, **kwargs).items():
+            self[key] = item
+
+    def setdefault(
+            self,
+            key: Hashable,
+            default: Optional[Field] = None
+    ) -> F:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
 
     def __getitem__(
             self,
@@ -195,29 +598,100 @@ class FieldDict(dict):
         if type(item) == tuple:
             item, return_value = item
 
-        if not len(self.search_by_name(name=item)):
-            return super().__getitem__(item)
-
-        return super().__getitem__(item).value if return_value else super().__getitem__(item)
+        field = super().__getitem__(item)
+        return field.value if return_value else field
 
     def __str__(
             self
     ) -> str:
         return str(self.to_value_dict())
 
+    def __reduce__(
+            self
+    ):
+        # By default, pickle restores dictionary items before instance attributes. Items are restored along with
+        # instance attributes instead, since indexes (see ``__setitem__``) are stored as instance attributes.
+        return copyreg.__newobj__, (self.__class__,), (self.__dict__, dict(self))
+
+    def __setstate__(
+            self,
+            state: Tuple[Dict, Dict]
+    ):
+        attributes, items = state
+        self.__dict__.update(attributes)
+        for key, field in items.items():
+            dict.__setitem__(self, key, field)
+
+    def __deepcopy__(
+            self,
+            memo: Dict
+    ):
+        return self.clone(memo=memo)
+
+    def clone(
+            self,
+            memo: Optional[Dict] = None
+    ):
+        """
+        Builds a copy of the ``FieldDict`` by cloning each of its ``Field`` (see ``Field.clone()``).
+        This is equivalent to a ``deepcopy`` without copying immutable ``Field`` metadata.
+
+        Args:
+            memo: the ``deepcopy`` memo dictionary
+
+        Returns:
+            The ``FieldDict`` copy.
+        """
+        memo = memo if memo is not None else {}
+        copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copy
+
+        # Conditions are pure functions: they are shared between copies
+        if 'conditions' in self:
+            memo.update({id(condition): condition for condition in self.conditions.values()})
+
+        copy.__dict__.update(deepcopy(self.__dict__, memo))
+        for key, field in self.items():
+            dict.__setitem__(copy, key, deepcopy(field, memo))
+        return copy
+
+    def _mark_modified(
+            self
+    ):
+        self.__dict__['_version'] = self._version + 1
+        self._search_cache.clear()
+
+    def _unindex_field(
+            self,
+            key: Hashable
+    ):
+        field = self.get(key)
+        if not isinstance(field, Field):
+            return
+
+        for tag in field.tags:
+            tag_names = self._tag_index.get(tag)
+            if tag_names is not None:
+                tag_names.discard(key)
+
+        exact_tag_names = self._exact_tag_index.get(frozenset(field.tags))
+        if exact_tag_names is not None:
+            exact_tag_names.discard(key)
+
     def to_value_dict(
             self
     ):
+        field_dict_type = type(self)
+
         def convert_field(field: F):
-            try:
-                check_type('field.value', field.value, Union[type(self), List[type(self)]])
-            except TypeError:
-                return field.value
+            value = field.value
+            if isinstance(value, field_dict_type):
+                return value.to_value_dict()
+
+            if isinstance(value, list) and all(isinstance(item, field_dict_type) for item in value):
+                return [item.to_value_dict() for item in value]
 
-            if type(field.value) == type(self):
-                return field.value.to_value_dict()
-            else:
-                return [item.to_value_dict() for item in field.value]
+            return value
 
         return {key: convert_field(field) for key, field in self.items() if key != 'conditions'}
 
@@ -246,53 +720,87 @@ class FieldDict(dict):
                            description=description,
                            tags=tags)
 
-        def typing_condition(
-                fields: FieldDict,
-                field_name: Hashable,
-                type_hint: Type
-        ) -> bool:
-            try:
-                found_param = fields.get(field_name)
-                check_type(argname=str(found_param.name),
-                           value=found_param.value,
-                           expected_type=type_hint)
-            except TypeError:
-                return False
-            return True
-
         # add type_hint condition
+        self._set_typing_condition(condition_name=f'{name}_typecheck',
+                                   field_name=name,
+                                   type_hint=type_hint)
+
+    def _set_typing_condition(
+            self,
+            condition_name: str,
+            field_name: Hashable,
+            type_hint: Optional[Type],
+            condition_type: Type[TypingCondition] = TypingCondition
+    ):
+        """
+        Adds, replaces or removes the type checking condition of a ``Field`` when the ``Field`` is (re-)added.
+        An existing condition that already checks ``type_hint`` is kept as it is.
+
+        Args:
+            condition_name: the unique identifier of the condition
+            field_name: unique identifier of the ``Field`` instance
+            type_hint: type annotation concerning ``Field.value``. If None, any existing type checking condition is
+                removed.
+            condition_type: the ``TypingCondition`` class to instantiate
+        """
+        existing = self.conditions.get(condition_name) if 'conditions' in self else None
+        if isinstance(existing, TypingCondition):
+            if type(existing) == condition_type and type_hint is not None and existing.type_hint == type_hint:
+                return
+            self.remove_condition(name=condition_name)
+
         if type_hint is not None:
-            self.add_condition(name=f'{name}_typecheck',
-                               condition=lambda fields: partial(typing_condition,
-                                                                field_name=name,
-                                                                type_hint=type_hint)(fields))
+            self.add_condition(name=condition_name,
+                               condition=condition_type(field_name=field_name,
+                                                        type_hint=type_hint))
 
     def add_condition(
             self,
             condition: Callable[[FieldDict], bool],
             name: Optional[str] = None,
-    ):
+    ) -> str:
         """
         Adds a condition to current ``FieldDict``.
+        If a condition with the same name already exists, the existing condition is kept.
 
         Args:
             condition: a function that receives as input the current ``FieldDict`` and returns a boolean
             name: a unique identifier of the condition (mainly for readability and debugging purposes)
 
+        Returns:
+            The name of the condition.
+
         Raises:
             ``AttributeError``: if the specified ``stage`` argument is not supported.
         """
         # Add conditions if first time
         if 'conditions' not in self:
             self.add(name='conditions',
-                     value={},
+                     value=ConditionsDict(),
                      type_hint=Dict[str, Callable[[FieldDict], bool]],
                      description='Stores conditions (callable boolean evaluators) '
                                  'that are used to assess the validity and correctness of this ParameterDict')
 
         if name is None:
             name = f'condition_{len(self.conditions) + 1}'
+        name = _intern(name)
         self.conditions.setdefault(name, condition)
+        self._mark_modified()
+        return name
+
+    def remove_condition(
+            self,
+            name: str
+    ):
+        """
+        Removes a condition from current ``FieldDict``, if it exists.
+
+        Args:
+            name: the unique identifier of the condition
+        """
+        if 'conditions' in self and name in self.conditions:
+            del self.conditions[name]
+            self._mark_modified()
 
     def validate(
             self,
@@ -312,11 +820,43 @@ class FieldDict(dict):
             ``ValidationFailureException``: if ``strict = True`` and the validation process failed
         """
 
-        for key, value in self.items():
-            if isinstance(key, FieldDict):
-                key_validation = key.validate(strict=strict)
-                if not key_validation.passed:
-                    return key_validation
+        # Nested ``FieldDict`` are visited iteratively to avoid one recursive call per nesting level.
+        # Children are looked up at each call since ``Field.value`` can be re-assigned at any time.
+        # Conditions are evaluated before visiting children to stop as soon as a condition fails.
+        # Nested ``FieldDict`` shared by multiple fields (or referencing an ancestor) are validated only once.
+        to_visit = [self]
+        visited = {id(self)}
+        while to_visit:
+            field_dict = to_visit.pop()
+            validation_result = field_dict._validate_conditions(strict=strict)
+            if not validation_result.passed:
+                return validation_result
+
+            for field in field_dict.values():
+                value = field.value
+                if isinstance(value, FieldDict) and id(value) not in visited:
+                    visited.add(id(value))
+                    to_visit.append(value)
+
+        return ValidationResult(passed=True)
+
+    def _validate_conditions(
+            self,
+            strict: bool = True
+    ) -> ValidationResult:
+        """
+        Calls all conditions of the current ``FieldDict``, without visiting nested ``FieldDict``.
+
+        Args:
+            strict: if True, a failed validation process will raise ``InvalidConfigurationException``
+
+        Returns:
+            A ``ValidationResult`` object that stores the boolean result of the validation process along with
+            an error message if the result is ``False``.
+
+        Raises:
+            ``ValidationFailureException``: if ``strict = True`` and the validation process failed
+        """
 
         if 'conditions' not in self:
             return ValidationResult(passed=True)
@@ -334,11 +874,13 @@ class FieldDict(dict):
 
     def search_by_tag(
             self,
-            tags: Optional[Union[Set[str], str]] = None,
+            tags: Optional[Union[Set[str], FrozenSet[str], str]] = None,
             exact_match: bool = True
     ) -> Dict[str, Any]:
         """
         Searches for all ``Field`` that match specified tags set.
+        ``Field.tags`` are indexed when the ``Field`` is added to the ``FieldDict``: they should not be modified
+        afterwards.
 
         Args:
             tags: a set of string tags to look for
@@ -347,13 +889,34 @@ class FieldDict(dict):
         Returns:
             A dictionary with ``Field.name`` as keys and ``Field`` as values
         """
-        if not type(tags) == set:
+        if not isinstance(tags, (set, frozenset)):
             tags = {tags}
+        tags = {_intern(tag) for tag in tags}
+
+        # Matching field names only change when fields are added or removed -> cache them
+        cache_key = (frozenset(tags), exact_match)
+        names = self._search_cache.get(cache_key)
+        if names is None:
+            names = self._search_names_by_tag(tags=tags, exact_match=exact_match)
+            self._search_cache[cache_key] = names
+
+        return {key: self.get(key).value for key in names}
+
+    def _search_names_by_tag(
+            self,
+            tags: Set[str],
+            exact_match: bool
+    ) -> List[Hashable]:
+        if exact_match:
+            return list(self._exact_tag_index.get(frozenset(tags), ()))
 
-        exatch_match_condition = lambda field: exact_match and field.tags == tags
-        partial_match_condition = lambda field: not exact_match and field.tags.intersection(tags) == tags
-        return {key: field.value for key, field in self.items()
-                if exatch_match_condition(field) or partial_match_condition(field) or tags is None}
+        # An empty tags set is contained in any field's tags
+        if not tags:
+            return list(self.keys())
+
+        # Every tag in the field's tags is indexed -> the answer is within the intersection of the tags' buckets
+        buckets = sorted([self._tag_index.get(tag, set()) for tag in tags], key=len)
+        return list(buckets[0].intersection(*buckets[1:]))
 
     def search_by_name(
             self,
@@ -368,7 +931,11 @@ class FieldDict(dict):
         Returns:
             A dictionary with ``Field.name`` as keys and ``Field`` as values
         """
-        return {key: field.value for key, field in self.items() if key == name or name is None}
+        if name is None:
+            return {key: field.value for key, field in self.items()}
+
+        field = self.get(name)
+        return {name: field.value} if field is not None else {}
 
 
 class Parameter(Field):
@@ -376,6 +943,9 @@ class Parameter(Field):
     A ``Field`` extension that is ``Configuration`` specific.
     """
 
+    __slots__ = ('allowed_range', 'affects_serialization', 'is_required', 'is_child', 'is_calibration',
+                 'build_from_registration', 'build_type_hint', 'variants')
+
     def __init__(
             self,
             allowed_range: Optional[Callable[[Any], bool]] = None,
@@ -412,6 +982,14 @@ class Parameter(Field):
         self.build_type_hint = build_type_hint
         self.variants = variants
 
+    def clone(
+            self,
+            memo: Optional[Dict] = None
+    ) -> F:
+        copy = super().clone(memo=memo)
+        copy.variants = deepcopy(self.variants, memo)
+        return copy
+
     def in_allowed_range(
             self
     ):
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import ast
 import importlib.util
+import json
+import os
 from dataclasses import dataclass
-from functools import partial
+from functools import partial, lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Type, AnyStr, List, Set, Dict, Any, Union, Optional, Callable
+from typing import Type, AnyStr, List, Set, Dict, Any, Union, Optional, Callable, Iterable, Tuple
+from weakref import WeakValueDictionary
 
 import networkx as nx
-from pyvis.network import Network
-from typeguard import check_type
 
 from cinnamon_core.core.component import Component
 from cinnamon_core.core.configuration import Configuration, C
@@ -24,9 +26,15 @@ class RegistrationKey:
     Compound key used for registration.
     """
 
+    # Keys are created in large numbers (e.g., as ``Registry`` entries and dependency graph nodes): slots avoid
+    # a per-instance ``__dict__``. ``__weakref__`` is required by the interning table.
+    __slots__ = ('name', 'namespace', 'tags', '_str', '_hash', '__weakref__')
+
     KEY_VALUE_SEPARATOR: str = ':'
     ATTRIBUTE_SEPARATOR: str = '--'
 
+    _INTERNED: WeakValueDictionary = WeakValueDictionary()
+
     def __init__(
             self,
             name: str,
@@ -52,51 +60,61 @@ class RegistrationKey:
         """
         self.name = name
         self.namespace = namespace if namespace is not None else 'default'
-        self.tags = tags if tags is not None else set()
+        self.tags = frozenset(tags) if tags else frozenset()
+
+        # Keys are used as identifiers in the Registry and are never modified after creation:
+        # their string format and hash are computed once
+        self._str = self._to_string()
+        self._hash = hash((self.name, self.namespace, self.tags))
+
+    def _to_string(
+            self
+    ) -> str:
+        key_value_separator, attribute_separator = self.KEY_VALUE_SEPARATOR, self.ATTRIBUTE_SEPARATOR
+
+        parts = ['name', key_value_separator, str(self.name)]
+        if self.tags:
+            # Tags are formatted as a JSON list to be parsed efficiently (see ``from_string()``)
+            parts += [attribute_separator, 'tags', key_value_separator,
+                      json.dumps(sorted(self.tags), ensure_ascii=False)]
+        parts += [attribute_separator, 'namespace', key_value_separator, str(self.namespace)]
+        return ''.join(parts)
 
     def __hash__(
             self
     ) -> int:
-        return hash(self.__str__())
+        return self._hash
 
     def __str__(
             self
     ) -> str:
-        to_return = f'name{self.KEY_VALUE_SEPARATOR}{self.name}'
-
-        if self.tags is not None:
-            tags = sorted(list(self.tags)) if self.tags else None
-            if tags is not None:
-                to_return += f'{self.ATTRIBUTE_SEPARATOR}tags{self.KEY_VALUE_SEPARATOR}{tags}'
-
-        to_return += f'{self.ATTRIBUTE_SEPARATOR}namespace{self.KEY_VALUE_SEPARATOR}{self.namespace}'
-        return to_return
+        return self._str
 
     def __repr__(
             self
     ) -> str:
-        return self.__str__()
+        return self._str
+
+    def __reduce__(
+            self
+    ):
+        # String hashes are salted per process: the cached hash is computed again when unpickling
+        return self.__class__, (self.name, self.namespace, self.tags)
 
     def __eq__(
             self,
             other
     ) -> bool:
-        if other is None or not isinstance(other, RegistrationKey):
-            return False
-
-        default_condition = lambda other: self.name == other.name
-
-        tags_condition = lambda other: (self.tags is not None and other.tags is not None and self.tags == other.tags) \
-                                       or (self.tags is None and other.tags is None)
+        if self is other:
+            return True
 
-        namespace_condition = lambda other: (self.namespace is not None
-                                             and other.namespace is not None
-                                             and self.namespace == other.namespace) \
-                                            or (self.namespace is None and other.namespace is None)
+        if not isinstance(other, RegistrationKey):
+            return NotImplemented
 
-        return default_condition(other) \
-            and tags_condition(other) \
-            and namespace_condition(other)
+        return self._hash == other._hash \
+            and self.name == other.name \
+            and self.namespace == other.namespace \
+            and self.tags == other.tags
 
     def partial_match(
             self,
@@ -107,7 +125,7 @@ class RegistrationKey:
         The following conditions are evaluated:
         - name: the two instances must have the same name
         - namespace: the two instances must have the same namespace
-        - tags: the two instances do not have any tag (``tags=None``) or one's tags are a subset of the other's tags.
+        - tags: the two instances do not have any tag or one's tags are a subset of the other's tags.
 
         Args:
             other: a ``RegistrationKey`` instance for which a partial match is issued.
@@ -116,19 +134,52 @@ class RegistrationKey:
             True if all the above conditions are True.
         """
 
-        name_condition = lambda other: self.name == other.name
+        if self.name != other.name or self.namespace != other.namespace:
+            return False
 
-        namespace_condition = lambda other: self.namespace == other.namespace
+        self_tags, other_tags = self.tags, other.tags
+        if not self_tags and not other_tags:
+            return True
 
-        tags_non_null_condition = lambda other: (self.tags is not None and len(self.tags)
-                                                 and other.tags is not None and len(other.tags))
-        tags_intersection_condition = lambda other: self.tags.intersection(other.tags) == other.tags \
-                                                    or self.tags.intersection(other.tags) == self.tags
-        tags_null_condition = lambda other: self.tags is None and other.tags is None
-        tags_condition = lambda other: (tags_non_null_condition(other) and tags_intersection_condition(other)) \
-                                       or tags_null_condition(other)
+        if self_tags and other_tags:
+            # Only the smaller set can be a subset of the other one
+            if len(self_tags) <= len(other_tags):
+                return self_tags.issubset(other_tags)
+            return other_tags.issubset(self_tags)
 
-        return name_condition(other) and tags_condition(other) and namespace_condition(other)
+        return False
+
+    @classmethod
+    def get(
+            cls,
+            name: str,
+            namespace: str = 'generic',
+            tags: Tag = None,
+    ) -> RegistrationKey:
+        """
+        Retrieves the ``RegistrationKey`` instance with the given attributes.
+        Keys are shared among callers: the same instance is returned as long as it is in use, which makes
+        ``Registry`` lookups resolve by identity.
+
+        Args:
+            name: the ``name`` field of ``RegistrationKey``
+            namespace: the ``namespace`` field of ``RegistrationKey``
+            tags: the ``tags`` field of ``RegistrationKey``
+
+        Returns:
+            The corresponding ``RegistrationKey`` instance
+        """
+
+        namespace = namespace if namespace is not None else 'default'
+        tags = frozenset(tags) if tags else frozenset()
+        lookup = (name, namespace, tags)
+        key = cls._INTERNED.get(lookup)
+        if key is None:
+            key = cls(name=name,
+                      namespace=namespace,
+                      tags=tags)
+            cls._INTERNED[lookup] = key
+        return key
 
     @classmethod
     def from_string(
@@ -145,20 +196,7 @@ class RegistrationKey:
             The corresponding parsed ``RegistrationKey`` instance
         """
 
-        registration_attributes = string_format.split(cls.ATTRIBUTE_SEPARATOR)
-        registration_dict = {}
-        for registration_attribute in registration_attributes:
-            try:
-                key, value = registration_attribute.split(cls.KEY_VALUE_SEPARATOR)
-                if key == 'tags':
-                    value = set(ast.literal_eval(value))
-
-                registration_dict[key] = value
-            except ValueError as e:
-                logging_utility.logger.exception(f'Failed parsing registration key from string.. Got: {string_format}')
-                raise e
-
-        return RegistrationKey(**registration_dict)
+        return _parse_registration_key(cls, string_format)
 
     @classmethod
     def parse(
@@ -176,10 +214,11 @@ class RegistrationKey:
             The parsed ``RegistrationKey`` instance
         """
 
-        check_type('registration_key', registration_key, Union[RegistrationKey, str])
-
-        if type(registration_key) == str:
+        if isinstance(registration_key, str):
             registration_key = RegistrationKey.from_string(string_format=registration_key)
+        elif not isinstance(registration_key, RegistrationKey):
+            raise TypeError(f'type of registration_key must be either {RegistrationKey} or {str}. '
+                            f'Got: {type(registration_key)}')
 
         return registration_key
 
@@ -187,6 +226,29 @@ class RegistrationKey:
 Registration = Union[RegistrationKey, str]
 
 
+@lru_cache(maxsize=4096)
+def _parse_registration_key(
+        key_class: Type[RegistrationKey],
+        string_format: str
+) -> RegistrationKey:
+    # Keys are never modified after creation: the same parsed instance can be shared
+    registration_attributes = string_format.split(key_class.ATTRIBUTE_SEPARATOR)
+    registration_dict = {}
+    for registration_attribute in registration_attributes:
+        try:
+            key, value = registration_attribute.split(key_class.KEY_VALUE_SEPARATOR)
+            if key == 'tags':
+                # Tags are formatted as a JSON list: legacy string formats (i.e., Python lists) are evaluated instead
+                value = json.loads(value) if value == '[]' or value.startswith('["') else ast.literal_eval(value)
+
+            registration_dict[key] = value
+        except ValueError as e:
+            logging_utility.logger.exception('Failed parsing registration key from string.. Got: %s', string_format)
+            raise e
+
+    return key_class.get(**registration_dict)
+
+
 class AlreadyRegisteredException(Exception):
 
     def __init__(
@@ -258,6 +320,106 @@ class NotADAGException(Exception):
         super().__init__(f'The built graph is not a DAG!')
 
 
+class RegistrationDict(dict):
+    """
+    A Python dictionary extension whose keys are ``RegistrationKey`` instances.
+    Keys are indexed by name and namespace for partial matching (see ``RegistrationKey.partial_match()``):
+    all dictionary updates keep the index in sync.
+    """
+
+    def __init__(
+            self,
+            *args,
+            **kwargs
+    ):
+        super().__init__()
+
+        # (name, namespace) -> keys, in insertion order
+        self.index: Dict[Tuple[str, str], Dict[RegistrationKey, None]] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(
+            self,
+            key: RegistrationKey,
+            value: Any
+    ):
+        if key not in self:
+            self.index.setdefault((key.name, key.namespace), {})[key] = None
+        super().__setitem__(key, value)
+
+    def __delitem__(
+            self,
+            key: RegistrationKey
+    ):
+        super().__delitem__(key)
+        bucket_key = (key.name, key.namespace)
+        bucket = self.index[bucket_key]
+        del bucket[key]
+        if not bucket:
+            del self.index[bucket_key]
+
+    def pop(
+            self,
+            key: RegistrationKey,
+            *args
+    ) -> Any:
+        if key not in self:
+            return super().pop(key, *args)
+
+        value = dict.__getitem__(self, key)
+        del self[key]
+        return value
+
+    def popitem(
+            self
+    ) -> Tuple[RegistrationKey, Any]:
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def clear(
+            self
+    ):
+        super().clear()
+        self.index.clear()
+
+    def update(
+            self,
+            *args,
+            **kwargs
+    ):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(
+            self,
+            key: RegistrationKey,
+            default: Any = None
+    ) -> Any:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def get_keys(
+            self,
+            name: str,
+            namespace: str
+    ) -> Iterable[RegistrationKey]:
+        """
+        Gets the keys with the given name and namespace.
+
+        Args:
+            name: the ``name`` field of ``RegistrationKey``
+            namespace: the ``namespace`` field of ``RegistrationKey``
+
+        Returns:
+            The matching keys, in insertion order.
+        """
+        return self.index.get((name, namespace), ())
+
+
 @dataclass
 class ConfigurationInfo:
     """
@@ -270,11 +432,15 @@ class ConfigurationInfo:
         - constructor: the method for creating an instance from the specified ``class_type``.
             By default, the constructor is set to ``Configuration.get_default()`` method.
         - kwargs: any potential constructor's function arguments.
+        - cacheable: if True, the ``constructor`` always builds the same ``Configuration`` and
+            ``Registry.build_configuration_from_key()`` can return copies of a previously built instance.
+            Disabled by default since constructors may depend on external state (e.g., files or random state).
     """
 
     class_type: Type[Configuration]
     constructor: Constructor
     kwargs: Any
+    cacheable: bool = False
 
 
 # TODO: to be updated
@@ -293,7 +459,7 @@ def register(
         return func
 
     if func not in Registry.REGISTRATION_METHODS and func.__module__ == Registry.REGISTER_SCOPE.name:
-        Registry.REGISTRATION_METHODS.append(func)
+        Registry.REGISTRATION_METHODS[func] = None
     return func
 
 
@@ -311,19 +477,26 @@ class Registry:
     All the above functionalities require to specify a ``RegistrationKey`` (either directly or indirectly).
     """
 
-    REGISTRY: Dict = {}
+    REGISTRY: RegistrationDict = RegistrationDict()
     BINDINGS: Dict = {}
     BUILT_REGISTRY: Dict = {}
 
-    REGISTRATION_METHODS: List = []
+    # Insertion-ordered: registration methods are executed in the order they are found
+    REGISTRATION_METHODS: Dict[Callable, None] = {}
     MODULE_SCOPE: AnyStr = None
     REGISTER_SCOPE: AnyStr = None
-    REGISTERED_NAMESPACES: List[str] = []
+    REGISTERED_NAMESPACES: Set[str] = set()
 
     ROOT_KEY = RegistrationKey(name='root', namespace='root')
     DEPENDENCY_DAG = nx.DiGraph()
     DEPENDENCY_DAG.add_node(ROOT_KEY)
+    DEPENDENCY_DAG_CHANGED: bool = True
+    RESOLUTION_ORDER: Dict = {}
     REGISTRATION_REGISTRY = {}
+    CONFIGURATION_CACHE: Dict = {}
+    BUILT_CONFIG_CACHE: Dict = {}
+    VARIANTS_CACHE: Dict = {}
+    EXPANDED_VARIANTS: Dict = {}
 
     @staticmethod
     def load_registrations(
@@ -334,18 +507,38 @@ class Registry:
         In particular, the Registry looks for ``register()`` functions in each found ``__init__.py``.
         These functions are the entry points for registrations: that is, where the ``Registry`` APIs are invoked
         to issue registrations.
+        Symbolic links to directories are not followed.
 
         Args:
             directory_path: path of the module
         """
 
-        directory_path = Path(directory_path) if type(directory_path) != Path else directory_path
+        directory_path = os.fspath(directory_path)
 
-        if not directory_path.exists() or not directory_path.is_dir():
+        if not os.path.isdir(directory_path):
             return
 
-        for config_folder in directory_path.rglob('configurations'):
-            for python_script in config_folder.glob('*.py'):
+        # Walk the module tree with scandir to avoid building a Path for every entry.
+        # Symbolic links to directories are not followed (as ``Path.rglob()``) to avoid cycles.
+        config_folders = []
+        folders = [directory_path]
+        while folders:
+            with os.scandir(folders.pop()) as entries:
+                for entry in entries:
+                    # __pycache__ folders only contain compiled files
+                    if entry.name == '__pycache__' or not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    if entry.name == 'configurations':
+                        config_folders.append(entry.path)
+                    folders.append(entry.path)
+
+        for config_folder in config_folders:
+            with os.scandir(config_folder) as entries:
+                python_scripts = [Path(entry.path) for entry in entries
+                                  if entry.name.endswith('.py') and entry.is_file()]
+
+            for python_script in python_scripts:
                 spec = importlib.util.spec_from_file_location(name=python_script.name,
                                                               location=python_script)
                 if spec is not None:
@@ -362,7 +555,7 @@ class Registry:
         spec.loader.exec_module(module)
         new_methods_size = len(Registry.REGISTRATION_METHODS)
         if new_methods_size > previous_methods_size:
-            for method in Registry.REGISTRATION_METHODS[previous_methods_size:]:
+            for method in islice(Registry.REGISTRATION_METHODS, previous_methods_size, None):
                 method()
 
     @staticmethod
@@ -375,7 +568,7 @@ class Registry:
         if namespace in _DEFAULT_PACKAGES:
             module_name = _DEFAULT_PACKAGES[namespace]
             if Registry.MODULE_SCOPE is None and namespace not in Registry.REGISTERED_NAMESPACES:
-                Registry.REGISTERED_NAMESPACES.append(namespace)
+                Registry.REGISTERED_NAMESPACES.add(namespace)
 
                 Registry.MODULE_SCOPE = module_name
                 module = importlib.import_module(module_name)
@@ -387,19 +580,39 @@ class Registry:
                 Registry.MODULE_SCOPE = None
 
     @staticmethod
-    def is_in_registry(
+    def _resolve_configuration_info(
             registration_key: RegistrationKey,
-    ) -> bool:
-        if registration_key in Registry.REGISTRY:
-            return True
+    ) -> Optional[ConfigurationInfo]:
+        config_info = Registry.REGISTRY.get(registration_key)
+        if config_info is not None:
+            return config_info
 
-        if registration_key.namespace not in Registry.REGISTERED_NAMESPACES:
-            Registry.try_resolve_module_from_namespace(namespace=registration_key.namespace)
+        # Only default packages can be resolved: other namespaces are not looked up again
+        namespace = registration_key.namespace
+        if namespace in _DEFAULT_PACKAGES and namespace not in Registry.REGISTERED_NAMESPACES:
+            Registry.try_resolve_module_from_namespace(namespace=namespace)
+            return Registry.REGISTRY.get(registration_key)
 
-        if registration_key not in Registry.REGISTRY:
-            return False
+        return None
 
-        return True
+    @staticmethod
+    def _make_key(
+            name: str,
+            namespace: str = 'generic',
+            tags: Tag = None,
+            is_default: bool = False
+    ) -> RegistrationKey:
+        if is_default and (tags is None or 'default' not in tags):
+            tags = tags | {'default'} if tags is not None else {'default'}
+        return RegistrationKey.get(name=name,
+                                   namespace=namespace,
+                                   tags=tags)
+
+    @staticmethod
+    def is_in_registry(
+            registration_key: RegistrationKey,
+    ) -> bool:
+        return Registry._resolve_configuration_info(registration_key=registration_key) is not None
 
     @staticmethod
     def clear(
@@ -415,7 +628,13 @@ class Registry:
         Registry.REGISTERED_NAMESPACES.clear()
 
         Registry.DEPENDENCY_DAG.clear()
+        Registry.DEPENDENCY_DAG_CHANGED = True
+        Registry.RESOLUTION_ORDER.clear()
         Registry.REGISTRATION_REGISTRY.clear()
+        Registry.CONFIGURATION_CACHE.clear()
+        Registry.BUILT_CONFIG_CACHE.clear()
+        Registry.VARIANTS_CACHE.clear()
+        Registry.EXPANDED_VARIANTS.clear()
 
     # Registration APIs
 
@@ -447,14 +666,14 @@ class Registry:
         """
         registration_key = RegistrationKey.parse(registration_key=registration_key)
 
-        if not Registry.is_in_registry(registration_key=registration_key):
+        registered_config_info = Registry._resolve_configuration_info(registration_key=registration_key)
+        if registered_config_info is None:
             raise NotRegisteredException(registration_key=registration_key)
 
-        registered_config_info = Registry.REGISTRY[registration_key]
         built_config = registered_config_info.constructor(**registered_config_info.kwargs)
 
-        if type(built_config) != registered_config_info.class_type:
-            raise InvalidConfigurationTypeException(expected_type=built_config.class_type,
+        if type(built_config) is not registered_config_info.class_type:
+            raise InvalidConfigurationTypeException(expected_type=registered_config_info.class_type,
                                                     actual_type=type(built_config))
         if registration_key not in Registry.BINDINGS:
             raise NotBoundException(registration_key=registration_key)
@@ -501,9 +720,9 @@ class Registry:
             ``NotBoundException``: if the ``Configuration`` is not bound to any ``Component``.
         """
 
-        config_regr_key = RegistrationKey(name=name,
-                                          tags=tags,
-                                          namespace=namespace)
+        config_regr_key = RegistrationKey.get(name=name,
+                                              tags=tags,
+                                              namespace=namespace)
         return Registry.build_component_from_key(registration_key=config_regr_key,
                                                  register_component_instance=register_built_component,
                                                  build_args=build_args)
@@ -525,7 +744,7 @@ class Registry:
             ``NotBoundException``: if the ``Configuration`` is not bound to any ``Component``.
         """
 
-        if type(registration_key) == str:
+        if isinstance(registration_key, str):
             registration_key = RegistrationKey.from_string(string_format=registration_key)
 
         if registration_key not in Registry.BINDINGS:
@@ -554,9 +773,9 @@ class Registry:
             ``NotBoundException``: if the ``Configuration`` is not bound to any ``Component``.
         """
 
-        registration_key = RegistrationKey(name=name,
-                                           tags=tags,
-                                           namespace=namespace)
+        registration_key = RegistrationKey.get(name=name,
+                                               tags=tags,
+                                               namespace=namespace)
         return Registry.retrieve_component_from_key(registration_key=registration_key)
 
     @staticmethod
@@ -600,11 +819,10 @@ class Registry:
             ``NotRegisteredException``: if the given ``registration_key`` is not found in the Registry.
         """
 
-        if is_default:
-            tags = tags.union('default') if tags is not None else {'default'}
-        built_regr_key = RegistrationKey(name=name,
-                                         tags=tags,
-                                         namespace=namespace)
+        built_regr_key = Registry._make_key(name=name,
+                                            namespace=namespace,
+                                            tags=tags,
+                                            is_default=is_default)
         Registry.register_built_component_from_key(component=component,
                                                    registration_key=built_regr_key)
 
@@ -648,11 +866,10 @@ class Registry:
             The built ``Component`` instance
         """
 
-        if is_default:
-            tags = tags.union('default') if tags is not None else {'default'}
-        config_regr_key = RegistrationKey(name=name,
-                                          tags=tags,
-                                          namespace=namespace)
+        config_regr_key = Registry._make_key(name=name,
+                                             namespace=namespace,
+                                             tags=tags,
+                                             is_default=is_default)
         return Registry.retrieve_component_instance_from_key(registration_key=config_regr_key)
 
     # Configuration
@@ -663,9 +880,9 @@ class Registry:
             namespace: str = 'generic',
             tags: Tag = None,
     ) -> bool:
-        key = RegistrationKey(name=name,
-                              tags=tags,
-                              namespace=namespace)
+        key = RegistrationKey.get(name=name,
+                                  tags=tags,
+                                  namespace=namespace)
         return Registry.is_in_graph_from_key(registration_key=key)
 
     @staticmethod
@@ -674,25 +891,99 @@ class Registry:
     ) -> bool:
         return registration_key in Registry.DEPENDENCY_DAG
 
+    @staticmethod
+    def add_dependency(
+            source: RegistrationKey,
+            target: RegistrationKey
+    ):
+        """
+        Adds a dependency edge to the ``Registry`` dependency graph.
+        Missing nodes are added as well.
+
+        Args:
+            source: the ``RegistrationKey`` depending on ``target``
+            target: the ``RegistrationKey`` ``source`` depends on
+        """
+        if not Registry.DEPENDENCY_DAG.has_edge(source, target):
+            Registry.DEPENDENCY_DAG.add_edge(source, target)
+            Registry.DEPENDENCY_DAG_CHANGED = True
+            Registry.RESOLUTION_ORDER.clear()
+
+    @staticmethod
+    def add_dependencies(
+            source: RegistrationKey,
+            targets: Iterable[RegistrationKey]
+    ):
+        """
+        Adds multiple dependency edges from the same ``RegistrationKey`` to the ``Registry`` dependency graph.
+        Missing nodes are added as well.
+
+        Args:
+            source: the ``RegistrationKey`` depending on ``targets``
+            targets: the ``RegistrationKey``s ``source`` depends on
+        """
+        graph = Registry.DEPENDENCY_DAG
+        new_edges = [(source, target) for target in targets if not graph.has_edge(source, target)]
+        if new_edges:
+            graph.add_edges_from(new_edges)
+            Registry.DEPENDENCY_DAG_CHANGED = True
+            Registry.RESOLUTION_ORDER.clear()
+
+    @staticmethod
+    def _get_dependency_keys(
+            config: Configuration
+    ) -> List[RegistrationKey]:
+        dependency_keys = []
+        for child in config.children.values():
+            if child.value is not None:
+                dependency_keys.append(child.value)
+
+            if child.variants is not None:
+                dependency_keys.extend(child.variants)
+        return dependency_keys
+
     @staticmethod
     def check_registration_graph(
 
     ) -> bool:
-        for node in Registry.DEPENDENCY_DAG.nodes():
-            if node == Registry.ROOT_KEY:
-                continue
+        # The graph is only checked again if it has been modified since the last successful check
+        if not Registry.DEPENDENCY_DAG_CHANGED:
+            return True
+
+        graph = Registry.DEPENDENCY_DAG
+        successors = graph.succ
+        isolated_nodes = []
+        in_degree = {}
+        for node, node_sources in graph.pred.items():
+            if node != Registry.ROOT_KEY:
+                if len(node_sources) > 1 and Registry.ROOT_KEY in node_sources:
+                    graph.remove_edge(Registry.ROOT_KEY, node)
+                elif not node_sources and not successors[node]:
+                    isolated_nodes.append(node)
 
-            node_sources = [edge[0] for edge in Registry.DEPENDENCY_DAG.in_edges(node)]
-            if len(node_sources) > 1 and Registry.ROOT_KEY in node_sources:
-                Registry.DEPENDENCY_DAG.remove_edge(Registry.ROOT_KEY, node)
+            in_degree[node] = len(node_sources)
 
-        isolated_nodes = list(nx.isolates(Registry.DEPENDENCY_DAG))
-        if len(isolated_nodes) > 0 and len(Registry.DEPENDENCY_DAG.nodes) > 1:
+        if Registry.ROOT_KEY in graph and not graph.degree(Registry.ROOT_KEY):
+            isolated_nodes.append(Registry.ROOT_KEY)
+
+        if len(isolated_nodes) > 0 and len(graph) > 1:
             raise DisconnectedGraphException(nodes=isolated_nodes)
 
-        if not nx.algorithms.dag.is_directed_acyclic_graph(Registry.DEPENDENCY_DAG):
+        # Kahn's algorithm: the graph is a DAG only if all its nodes can be topologically sorted
+        sources = [node for node, degree in in_degree.items() if not degree]
+        sorted_nodes = 0
+        while sources:
+            node = sources.pop()
+            sorted_nodes += 1
+            for successor in successors[node]:
+                in_degree[successor] -= 1
+                if not in_degree[successor]:
+                    sources.append(successor)
+
+        if sorted_nodes != len(in_degree):
             raise NotADAGException()
 
+        Registry.DEPENDENCY_DAG_CHANGED = False
         return True
 
     @staticmethod
@@ -709,11 +1000,21 @@ class Registry:
             The built configuration
         """
 
-        if not Registry.is_in_registry(registration_key=registration_key):
+        registration_key = RegistrationKey.parse(registration_key=registration_key)
+
+        config_info = Registry._resolve_configuration_info(registration_key=registration_key)
+        if config_info is None:
             raise NotRegisteredException(registration_key=registration_key)
 
-        config_info = Registry.retrieve_configurations_from_key(registration_key=registration_key)
-        return config_info.constructor(**config_info.kwargs)
+        if not config_info.cacheable:
+            return config_info.constructor(**config_info.kwargs)
+
+        # Cached instances are never returned: callers always get their own copy
+        config = Registry.CONFIGURATION_CACHE.get(registration_key)
+        if config is None:
+            config = config_info.constructor(**config_info.kwargs)
+            Registry.CONFIGURATION_CACHE[registration_key] = config
+        return config.clone()
 
     @staticmethod
     def build_configuration(
@@ -733,9 +1034,9 @@ class Registry:
             The built configuration
         """
 
-        registration_key = RegistrationKey(name=name,
-                                           tags=tags,
-                                           namespace=namespace)
+        registration_key = RegistrationKey.get(name=name,
+                                               tags=tags,
+                                               namespace=namespace)
         return Registry.build_configuration_from_key(registration_key=registration_key)
 
     @staticmethod
@@ -747,6 +1048,7 @@ class Registry:
             is_default: bool = False,
             config_constructor: Optional[Constructor] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ) -> RegistrationKey:
         """
         Registers a ``Configuration`` in the ``Registry`` via implicit ``RegistrationKey``.
@@ -760,6 +1062,8 @@ class Registry:
             is_default: if True, the 'default' tag is automatically added to configuration tags
             config_constructor: the constructor method to build the ``Configuration`` instance from its class
             config_kwargs: potential arguments to the ``configuration_constructor`` method.
+            cacheable: if True, the built ``Configuration`` is cached and ``Registry.build_configuration_from_key()``
+                returns copies of it. Enable it only if ``config_constructor`` always builds the same ``Configuration``.
 
         Returns:
             The built ``RegistrationKey`` instance that can be used to retrieve the registered ``ConfigurationInfo``.
@@ -768,16 +1072,15 @@ class Registry:
             ``AlreadyRegisteredException``: if the ``RegistrationKey`` is already used
         """
 
-        tags = tags.union({'default'}) if tags is not None and is_default else tags
-        if tags is None and is_default:
-            tags = {'default'}
-        registration_key = RegistrationKey(name=name,
-                                           tags=tags,
-                                           namespace=namespace)
+        registration_key = Registry._make_key(name=name,
+                                              namespace=namespace,
+                                              tags=tags,
+                                              is_default=is_default)
         return Registry.register_configuration_from_key(config_class=config_class,
                                                         registration_key=registration_key,
                                                         config_constructor=config_constructor,
-                                                        config_kwargs=config_kwargs)
+                                                        config_kwargs=config_kwargs,
+                                                        cacheable=cacheable)
 
     @staticmethod
     def register_configuration_from_key(
@@ -785,6 +1088,7 @@ class Registry:
             registration_key: RegistrationKey,
             config_constructor: Optional[Constructor] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ):
         """
         Registers a ``Configuration`` in the ``Registry`` via explicit ``RegistrationKey``.
@@ -795,6 +1099,8 @@ class Registry:
             registration_key: the ``RegistrationKey`` instance to use to register the ``Configuration``
             config_constructor: the constructor method to build the ``Configuration`` instance from its class
             config_kwargs: potential arguments to the ``configuration_constructor`` method.
+            cacheable: if True, the built ``Configuration`` is cached and ``Registry.build_configuration_from_key()``
+                returns copies of it. Enable it only if ``config_constructor`` always builds the same ``Configuration``.
 
         Returns:
             The built ``RegistrationKey`` instance that can be used to retrieve the registered ``ConfigurationInfo``.
@@ -813,9 +1119,39 @@ class Registry:
         config_kwargs = config_kwargs if config_kwargs is not None else {}
         Registry.REGISTRY[registration_key] = ConfigurationInfo(class_type=config_class,
                                                                 constructor=config_constructor,
-                                                                kwargs=config_kwargs)
+                                                                kwargs=config_kwargs,
+                                                                cacheable=cacheable)
         return registration_key
 
+    @staticmethod
+    def _build_config(
+            config_constructor: Constructor,
+            config_kwargs: Dict
+    ) -> Configuration:
+        """
+        Builds a ``Configuration`` to inspect its children while adding it to the dependency graph.
+        The built instance is shared by registrations with the same constructor and arguments: it must not be
+        modified.
+
+        Args:
+            config_constructor: the constructor method to build the ``Configuration`` instance
+            config_kwargs: the ``config_constructor`` arguments
+
+        Returns:
+            The built ``Configuration`` instance
+        """
+        try:
+            cache_key = (config_constructor, frozenset(config_kwargs.items()))
+            built_config = Registry.BUILT_CONFIG_CACHE.get(cache_key)
+        except TypeError:
+            # Unhashable constructor arguments
+            return config_constructor(**config_kwargs)
+
+        if built_config is None:
+            built_config = config_constructor(**config_kwargs)
+            Registry.BUILT_CONFIG_CACHE[cache_key] = built_config
+        return built_config
+
     @staticmethod
     def add_configuration(
             config_class: Type[Configuration],
@@ -825,17 +1161,17 @@ class Registry:
             is_default: bool = False,
             config_constructor: Optional[Constructor] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ):
-        tags = tags.union({'default'}) if tags is not None and is_default else tags
-        if tags is None and is_default:
-            tags = {'default'}
-        registration_key = RegistrationKey(name=name,
-                                           tags=tags,
-                                           namespace=namespace)
+        registration_key = Registry._make_key(name=name,
+                                              namespace=namespace,
+                                              tags=tags,
+                                              is_default=is_default)
         Registry.add_configuration_from_key(config_class=config_class,
                                             registration_key=registration_key,
                                             config_constructor=config_constructor,
-                                            config_kwargs=config_kwargs)
+                                            config_kwargs=config_kwargs,
+                                            cacheable=cacheable)
 
     @staticmethod
     def add_configuration_from_key(
@@ -843,29 +1179,19 @@ class Registry:
             registration_key: RegistrationKey,
             config_constructor: Optional[Constructor] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ):
         if not Registry.is_in_graph_from_key(registration_key=registration_key):
-            Registry.DEPENDENCY_DAG.add_node(registration_key)
-            Registry.DEPENDENCY_DAG.add_edge(Registry.ROOT_KEY, registration_key)
+            Registry.add_dependency(source=Registry.ROOT_KEY, target=registration_key)
 
         # Check children
         config_kwargs = config_kwargs if config_kwargs is not None else {}
         config_constructor = config_constructor if config_constructor is not None else config_class.get_default
 
-        built_config = config_constructor(**config_kwargs)
-        for child_name, child in built_config.children.items():
-            child_key = child.value
-            if child_key is not None:
-                if not Registry.is_in_graph_from_key(child_key):
-                    Registry.DEPENDENCY_DAG.add_node(child_key)
-
-                Registry.DEPENDENCY_DAG.add_edge(registration_key, child_key)
-
-            if child.variants is not None:
-                for variant in child.variants:
-                    if not Registry.is_in_graph_from_key(variant):
-                        Registry.DEPENDENCY_DAG.add_node(variant)
-                    Registry.DEPENDENCY_DAG.add_edge(registration_key, variant)
+        built_config = Registry._build_config(config_constructor=config_constructor,
+                                              config_kwargs=config_kwargs)
+        Registry.add_dependencies(source=registration_key,
+                                  targets=Registry._get_dependency_keys(config=built_config))
 
         # Memo registration method
         if registration_key not in Registry.REGISTRATION_REGISTRY:
@@ -873,7 +1199,8 @@ class Registry:
                                                                        config_class=config_class,
                                                                        registration_key=registration_key,
                                                                        config_constructor=config_constructor,
-                                                                       config_kwargs=config_kwargs)
+                                                                       config_kwargs=config_kwargs,
+                                                                       cacheable=cacheable)
 
     @staticmethod
     def retrieve_configurations_from_key(
@@ -898,21 +1225,20 @@ class Registry:
             ``NotRegisteredException``: if ``strict = True`` and no ``ConfigurationInfo`` is found in the ``Registry``
             using the specified ``registration_key``.
         """
-        # Trigger potential latent registrations before attempting registry lookup
-        Registry.is_in_registry(registration_key=registration_key)
-
         registration_key = RegistrationKey.parse(registration_key=registration_key)
 
+        # Trigger potential latent registrations before attempting registry lookup
         if exact_match:
-            configurations = Registry.REGISTRY.get(registration_key, None)
+            configurations = Registry._resolve_configuration_info(registration_key=registration_key)
         else:
-            configurations = [Registry.REGISTRY.get(key, None)
-                              for key in Registry.REGISTRY if key.partial_match(key)]
-
-        if (configurations is None
-            or (type(configurations) == List
-                and any([item is None for item in configurations]))) \
-                and strict:
+            Registry.is_in_registry(registration_key=registration_key)
+            # Partial matches always share name and namespace
+            candidates = Registry.REGISTRY.get_keys(name=registration_key.name,
+                                                    namespace=registration_key.namespace)
+            configurations = [Registry.REGISTRY[key]
+                              for key in candidates if key.partial_match(registration_key)]
+
+        if not configurations and strict:
             raise NotRegisteredException(registration_key=registration_key)
 
         return configurations
@@ -945,9 +1271,9 @@ class Registry:
             using the specified ``registration_key``.
         """
 
-        registration_key = RegistrationKey(name=name,
-                                           tags=tags,
-                                           namespace=namespace)
+        registration_key = RegistrationKey.get(name=name,
+                                               tags=tags,
+                                               namespace=namespace)
         return Registry.retrieve_configurations_from_key(registration_key=registration_key,
                                                          exact_match=exact_match,
                                                          strict=strict)
@@ -997,10 +1323,10 @@ class Registry:
         Raises:
             ``NotRegisteredException``: if ``registration_key`` is not in the ``Registry``.
         """
-        Registry.bind_from_key(registration_key=RegistrationKey(namespace=namespace,
-                                                                name=name,
-                                                                tags=tags),
-                               component_class=component_class)
+        Registry.bind_from_key(registration_key=RegistrationKey.get(namespace=namespace,
+                                                                    name=name,
+                                                                    tags=tags),
+                                   component_class=component_class)
 
     @staticmethod
     def register_and_bind(
@@ -1011,7 +1337,8 @@ class Registry:
             tags: Tag = None,
             is_default: bool = False,
             config_constructor: Optional[Constructor] = None,
-            config_kwargs: Optional[Dict] = None
+            config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ) -> RegistrationKey:
         """
         Registers a ``Configuration`` and binds it to a ``Component``.
@@ -1025,21 +1352,21 @@ class Registry:
             config_constructor: the constructor method to build the ``Configuration`` instance from its class
             config_kwargs: potential arguments to the ``configuration_constructor`` method.
             is_default: if True, the tag ``default`` is added to ``tags``
+            cacheable: if True, the built ``Configuration`` is cached and ``Registry.build_configuration_from_key()``
+                returns copies of it. Enable it only if ``config_constructor`` always builds the same ``Configuration``.
 
         Returns:
             The ``RegistrationKey`` instance used to register the ``Configuration``.
         """
 
-        tags = tags.union({'default'}) if tags is not None and is_default else tags
-        if tags is None and is_default:
-            tags = {'default'}
-
         key = Registry.register_configuration(config_class=config_class,
                                               config_constructor=config_constructor,
                                               config_kwargs=config_kwargs,
                                               name=name,
                                               tags=tags,
-                                              namespace=namespace)
+                                              namespace=namespace,
+                                              is_default=is_default,
+                                              cacheable=cacheable)
 
         Registry.bind_from_key(registration_key=key,
                                component_class=component_class)
@@ -1056,44 +1383,95 @@ class Registry:
             is_default: bool = False,
             config_constructor: Optional[Constructor] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ):
-        tags = tags.union({'default'}) if tags is not None and is_default else tags
-        if tags is None and is_default:
-            tags = {'default'}
-        registration_key = RegistrationKey(name=name,
-                                           tags=tags,
-                                           namespace=namespace)
+        registration_key = Registry._make_key(name=name,
+                                              namespace=namespace,
+                                              tags=tags,
+                                              is_default=is_default)
         if not Registry.is_in_graph_from_key(registration_key=registration_key):
-            Registry.DEPENDENCY_DAG.add_node(registration_key)
-            Registry.DEPENDENCY_DAG.add_edge(Registry.ROOT_KEY, registration_key)
+            Registry.add_dependency(source=Registry.ROOT_KEY, target=registration_key)
 
         config_kwargs = config_kwargs if config_kwargs is not None else {}
         config_constructor = config_constructor if config_constructor is not None else config_class.get_default
 
-        built_config = config_constructor(**config_kwargs)
-        for child_name, child in built_config.children.items():
-            child_key = child.value
-            if child_key is not None:
-                if not Registry.is_in_graph_from_key(child_key):
-                    Registry.DEPENDENCY_DAG.add_node(child_key)
-
-                Registry.DEPENDENCY_DAG.add_edge(registration_key, child_key)
-
-            if child.variants is not None:
-                for variant in child.variants:
-                    if not Registry.is_in_graph_from_key(variant):
-                        Registry.DEPENDENCY_DAG.add_node(variant)
-                    Registry.DEPENDENCY_DAG.add_edge(registration_key, variant)
+        built_config = Registry._build_config(config_constructor=config_constructor,
+                                              config_kwargs=config_kwargs)
+        Registry.add_dependencies(source=registration_key,
+                                  targets=Registry._get_dependency_keys(config=built_config))
 
         if registration_key not in Registry.REGISTRATION_REGISTRY:
             Registry.REGISTRATION_REGISTRY[registration_key] = partial(Registry.register_and_bind,
                                                                        config_class=config_class,
                                                                        component_class=component_class,
                                                                        name=name,
-                                                                       tags=tags,
+                                                                       tags=registration_key.tags,
                                                                        namespace=namespace,
                                                                        config_constructor=config_constructor,
-                                                                       config_kwargs=config_kwargs)
+                                                                       config_kwargs=config_kwargs,
+                                                                       cacheable=cacheable)
+
+    @staticmethod
+    def _get_variants_combinations(
+            built_config: Configuration,
+            config_constructor: Constructor,
+            config_kwargs: Dict,
+            validate: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets the variant combinations of a built ``Configuration`` (see ``Configuration.get_variants_combinations()``).
+        Combinations are shared by configurations built with the same constructor, arguments and variants.
+
+        Args:
+            built_config: the ``Configuration`` instance built via ``config_constructor``
+            config_constructor: the constructor method used to build ``built_config``
+            config_kwargs: the ``config_constructor`` arguments
+            validate: if True, only valid configuration variants are returned.
+
+        Returns:
+            List of variant combinations.
+        """
+        try:
+            variants = tuple((param_key, tuple(param.variants)) for param_key, param in built_config.items()
+                             if param.variants)
+            cache_key = (config_constructor, frozenset(config_kwargs.items()), variants, validate)
+            combinations = Registry.VARIANTS_CACHE.get(cache_key)
+        except TypeError:
+            # Unhashable constructor arguments or variants
+            return built_config.get_variants_combinations(validate=validate)
+
+        if combinations is None:
+            combinations = built_config.get_variants_combinations(validate=validate)
+            Registry.VARIANTS_CACHE[cache_key] = combinations
+        return combinations
+
+    @staticmethod
+    def _iterate_combination_tags(
+            combination: Dict[str, Any],
+            namespace: str
+    ) -> Iterable[str]:
+        """
+        Iterates over the tags describing a combination of parameter variants.
+
+        Args:
+            combination: a dictionary with ``Parameter.name`` as keys and ``Parameter.value`` as values
+            namespace: the ``namespace`` field of the ``RegistrationKey`` of the combination
+
+        Returns:
+            The combination tags: ``key=value`` for plain values, ``key.tag`` for each tag of ``RegistrationKey`` values
+            (plus ``key.namespace`` if their namespace differs from ``namespace``).
+        """
+        key_items = []
+        for key, value in combination.items():
+            if isinstance(value, RegistrationKey):
+                key_items.append((key, value))
+            else:
+                yield f'{key}={value}'
+
+        for key, value in key_items:
+            yield from (f'{key}.{tag}' for tag in value.tags)
+            if value.namespace != namespace:
+                yield f'{key}.{value.namespace}'
 
     @staticmethod
     def register_and_bind_variants(
@@ -1104,6 +1482,7 @@ class Registry:
             tags: Tag = None,
             config_constructor: Callable[[Any], Configuration] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ) -> Optional[List[RegistrationKey]]:
         """
         Registers and binds all possible ``Configuration`` variants.
@@ -1119,6 +1498,8 @@ class Registry:
             namespace: the ``namespace`` field of ``RegistrationKey``
             config_constructor: callable that builds the configuration instance (just like ``get_default()``)
             config_kwargs: optional constructor arguments
+            cacheable: if True, the built ``Configuration`` is cached and ``Registry.build_configuration_from_key()``
+                returns copies of it. Enable it only if ``config_constructor`` always builds the same ``Configuration``.
 
         Returns:
             the list of ``RegistrationKey`` used to register each ``Configuration`` variant
@@ -1131,9 +1512,15 @@ class Registry:
 
         new_registered_keys = []
 
-        main_key = RegistrationKey(name=name,
-                                   tags=tags,
-                                   namespace=namespace)
+        main_key = RegistrationKey.get(name=name,
+                                       tags=tags,
+                                       namespace=namespace)
+
+        # The variants of an expanded key are already registered: only its combination keys are returned again
+        expanded_keys = Registry.EXPANDED_VARIANTS.get(main_key)
+        if expanded_keys is not None:
+            return [key for key in expanded_keys if key != main_key]
+
         if not Registry.is_in_registry(registration_key=main_key):
             Registry.register_and_bind(config_class=config_class,
                                        component_class=component_class,
@@ -1141,15 +1528,17 @@ class Registry:
                                        config_kwargs=config_kwargs,
                                        name=name,
                                        tags=tags,
-                                       namespace=namespace)
+                                       namespace=namespace,
+                                       cacheable=cacheable)
             new_registered_keys.append(main_key)
 
         if not Registry.is_in_graph_from_key(registration_key=main_key):
-            Registry.DEPENDENCY_DAG.add_node(main_key)
-            Registry.DEPENDENCY_DAG.add_edge(Registry.ROOT_KEY, main_key)
+            Registry.add_dependency(source=Registry.ROOT_KEY, target=main_key)
 
         built_config = config_constructor(**config_kwargs)
 
+        bindings = Registry.BINDINGS
+
         # Add variants to each registration child
         for child_name, child in built_config.children.items():
             child_key = child.value
@@ -1159,9 +1548,9 @@ class Registry:
                 for variant in child.variants:
                     variant_config_info = Registry.retrieve_configurations_from_key(registration_key=variant,
                                                                                     exact_match=True)
-                    if variant not in Registry.BINDINGS:
+                    variant_component_class = bindings.get(variant)
+                    if variant_component_class is None:
                         raise NotBoundException(registration_key=variant)
-                    variant_component_class = Registry.BINDINGS[variant]
                     child_variants.extend(Registry.register_and_bind_variants(
                         config_class=variant_config_info.class_type,
                         component_class=variant_component_class,
@@ -1169,15 +1558,16 @@ class Registry:
                         tags=variant.tags,
                         namespace=variant.namespace,
                         config_constructor=variant_config_info.constructor,
-                        config_kwargs=variant_config_info.kwargs))
+                        config_kwargs=variant_config_info.kwargs,
+                        cacheable=variant_config_info.cacheable))
 
             if child_key is not None:
                 child_config_info = Registry.retrieve_configurations_from_key(registration_key=child_key,
                                                                               exact_match=True)
-                if child_key not in Registry.BINDINGS:
+                child_component_class = bindings.get(child_key)
+                if child_component_class is None:
                     raise NotBoundException(registration_key=child_key)
 
-                child_component_class = Registry.BINDINGS[child_key]
                 child_variants.extend(Registry.register_and_bind_variants(
                     config_class=child_config_info.class_type,
                     component_class=child_component_class,
@@ -1185,17 +1575,12 @@ class Registry:
                     tags=child_key.tags if child_key.tags else None,
                     namespace=child_key.namespace,
                     config_constructor=child_config_info.constructor,
-                    config_kwargs=child_config_info.kwargs))
-
-                if Registry.is_in_graph_from_key(child_key):
-                    Registry.DEPENDENCY_DAG.add_node(child_key)
-                if (main_key, child_key) not in Registry.DEPENDENCY_DAG.edges:
-                    Registry.DEPENDENCY_DAG.add_edge(main_key, child_key)
+                    config_kwargs=child_config_info.kwargs,
+                    cacheable=child_config_info.cacheable))
 
-            if main_key.name == 'calibrator':
-                print()
+                Registry.add_dependency(source=main_key, target=child_key)
 
-            child_variants = list(set(child_variants))
+            child_variants = list(dict.fromkeys(child_variants))
             child.variants = child.variants if child.variants is not None else []
             built_config.get(child_name).variants = child_variants + child.variants
 
@@ -1204,28 +1589,25 @@ class Registry:
                                                                         for key in built_config.get(child_name).variants]
 
         # Register each combination of parameter variants
-        parameter_combinations = built_config.get_variants_combinations()
+        parameter_combinations = Registry._get_variants_combinations(built_config=built_config,
+                                                                     config_constructor=config_constructor,
+                                                                     config_kwargs=config_kwargs)
 
         # No combinations have been found -> check if already registered
         if not len(parameter_combinations):
+            Registry.EXPANDED_VARIANTS[main_key] = new_registered_keys
             return new_registered_keys
 
         # Register each combination
+        base_tags = frozenset(tags) if tags is not None else frozenset()
         combination_keys = []
         for combination in parameter_combinations:
-            combination_tags = set()
-            for key, value in combination.items():
-                if type(value) != RegistrationKey:
-                    combination_tags.add(f'{key}={value}')
-                else:
-                    for tag in value.tags:
-                        combination_tags.add(f'{key}.{tag}')
-                    if value.namespace != namespace:
-                        combination_tags.add(f'{key}.{value.namespace}')
-            combination_tags = tags.union(combination_tags) if tags is not None else combination_tags
-            combination_key = RegistrationKey(name=name,
-                                              tags=combination_tags,
-                                              namespace=namespace)
+            combination_tags = set(Registry._iterate_combination_tags(combination=combination,
+                                                                     namespace=namespace))
+            combination_tags.update(base_tags)
+            combination_key = RegistrationKey.get(name=name,
+                                                  tags=combination_tags,
+                                                  namespace=namespace)
             combination_keys.append(str(combination_key))
 
             if not Registry.is_in_registry(registration_key=combination_key):
@@ -1239,11 +1621,13 @@ class Registry:
                                                              component_class=component_class,
                                                              name=name,
                                                              tags=combination_tags,
-                                                             namespace=namespace)
+                                                             namespace=namespace,
+                                                             cacheable=cacheable)
             new_registered_keys.append(combination_key)
 
         Registry.DEPENDENCY_DAG.nodes[main_key]['variants'] = combination_keys
 
+        Registry.EXPANDED_VARIANTS[main_key] = new_registered_keys
         return new_registered_keys
 
     @staticmethod
@@ -1255,6 +1639,7 @@ class Registry:
             tags: Tag = None,
             config_constructor: Callable[[Any], Configuration] = None,
             config_kwargs: Optional[Dict] = None,
+            cacheable: bool = False
     ):
         """
         Registers and binds all possible ``Configuration`` variants.
@@ -1270,6 +1655,8 @@ class Registry:
             namespace: the ``namespace`` field of ``RegistrationKey``
             config_constructor: callable that builds the configuration instance (just like ``get_default()``)
             config_kwargs: optional constructor arguments
+            cacheable: if True, the built ``Configuration`` is cached and ``Registry.build_configuration_from_key()``
+                returns copies of it. Enable it only if ``config_constructor`` always builds the same ``Configuration``.
 
         Returns:
             the list of ``RegistrationKey`` used to register each ``Configuration`` variant
@@ -1278,7 +1665,7 @@ class Registry:
         config_kwargs = config_kwargs if config_kwargs is not None else {}
 
         # Main key
-        main_key = RegistrationKey(name=name, tags=tags, namespace=namespace)
+        main_key = RegistrationKey.get(name=name, tags=tags, namespace=namespace)
 
         if main_key not in Registry.REGISTRATION_REGISTRY:
             Registry.REGISTRATION_REGISTRY[main_key] = partial(Registry.register_and_bind_variants,
@@ -1288,69 +1675,90 @@ class Registry:
                                                                tags=tags,
                                                                namespace=namespace,
                                                                config_constructor=config_constructor,
-                                                               config_kwargs=config_kwargs)
+                                                               config_kwargs=config_kwargs,
+                                                               cacheable=cacheable)
 
-        if not Registry.is_in_graph(name=name, tags=tags, namespace=namespace):
-            Registry.DEPENDENCY_DAG.add_node(main_key)
-            Registry.DEPENDENCY_DAG.add_edge(Registry.ROOT_KEY, main_key)
+        if not Registry.is_in_graph_from_key(registration_key=main_key):
+            Registry.add_dependency(source=Registry.ROOT_KEY, target=main_key)
 
-        built_config = config_constructor(**config_kwargs)
+        built_config = Registry._build_config(config_constructor=config_constructor,
+                                              config_kwargs=config_kwargs)
 
-        for child_name, child in built_config.children.items():
-            child_key = child.value
-            if child_key is not None:
-                if not Registry.is_in_graph_from_key(child_key):
-                    Registry.DEPENDENCY_DAG.add_node(child_key)
-
-                Registry.DEPENDENCY_DAG.add_edge(main_key, child_key)
-
-            if child.variants is not None:
-                for variant in child.variants:
-                    if not Registry.is_in_graph_from_key(variant):
-                        Registry.DEPENDENCY_DAG.add_node(variant)
-                    Registry.DEPENDENCY_DAG.add_edge(main_key, variant)
+        Registry.add_dependencies(source=main_key,
+                                  targets=Registry._get_dependency_keys(config=built_config))
 
         # Register each combination of parameter variants
-        parameter_combinations = built_config.get_variants_combinations(validate=False)
+        parameter_combinations = Registry._get_variants_combinations(built_config=built_config,
+                                                                     config_constructor=config_constructor,
+                                                                     config_kwargs=config_kwargs,
+                                                                     validate=False)
 
         # Register each combination
+        base_tags = frozenset(tags) if tags is not None else frozenset()
         combination_keys = []
         for combination in parameter_combinations:
-            combination_tags = set()
-            for key, value in combination.items():
-                if type(value) != RegistrationKey:
-                    combination_tags.add(f'{key}={value}')
-                else:
-                    for tag in value.tags:
-                        combination_tags.add(f'{key}.{tag}')
-                    if value.namespace != namespace:
-                        combination_tags.add(f'{key}.{value.namespace}')
-            combination_tags = tags.union(combination_tags) if tags is not None else combination_tags
-            combination_key = RegistrationKey(name=name,
-                                              tags=combination_tags,
-                                              namespace=namespace)
+            combination_tags = set(Registry._iterate_combination_tags(combination=combination,
+                                                                     namespace=namespace))
+            combination_tags.update(base_tags)
+            combination_key = RegistrationKey.get(name=name,
+                                                  tags=combination_tags,
+                                                  namespace=namespace)
             combination_keys.append(str(combination_key))
 
         Registry.DEPENDENCY_DAG.nodes[main_key]['variants'] = combination_keys
 
+    @staticmethod
+    def _get_resolution_order(
+            namespace: Optional[str] = None
+    ) -> List[RegistrationKey]:
+        """
+        Gets the dependency graph nodes in reversed topological order (i.e., dependencies first).
+        Orders are computed once per namespace and reused until a dependency is added to the graph.
+        Removing edges does not invalidate them since a topological order holds for any subgraph.
+
+        Args:
+            namespace: if specified, only the nodes belonging to the given namespace are returned.
+
+        Returns:
+            The list of ``RegistrationKey`` sorted in reversed topological order.
+        """
+        order = Registry.RESOLUTION_ORDER.get(namespace)
+        if order is not None:
+            return order
+
+        if namespace is None:
+            order = list(nx.topological_sort(Registry.DEPENDENCY_DAG))
+            order.reverse()
+        else:
+            order = [key for key in Registry._get_resolution_order() if key.namespace == namespace]
+
+        Registry.RESOLUTION_ORDER[namespace] = order
+        return order
+
     @staticmethod
     def expand_and_resolve_registration(
             namespace: Optional[str] = None
     ):
-        topological_sorted = list(reversed(list(nx.topological_sort(Registry.DEPENDENCY_DAG))))
+        Registry.BUILT_CONFIG_CACHE.clear()
+        Registry.VARIANTS_CACHE.clear()
 
-        if namespace is not None:
-            topological_sorted = [key for key in topological_sorted if key.namespace == namespace]
+        topological_sorted = Registry._get_resolution_order(namespace=namespace)
 
+        # A registration method shared by multiple keys is only issued once
+        executed_methods = set()
         for key in topological_sorted:
-            if key in Registry.REGISTRATION_REGISTRY:
-                registration_method = Registry.REGISTRATION_REGISTRY.pop(key)
-                Registry.REGISTRATION_REGISTRY = {key: value for key, value in Registry.REGISTRATION_REGISTRY.items()
-                                                  if value != registration_method}
-                registration_method()
+            registration_method = Registry.REGISTRATION_REGISTRY.pop(key, None)
+            if registration_method is None or registration_method in executed_methods:
+                continue
+
+            executed_methods.add(registration_method)
+            registration_method()
 
     @staticmethod
     def show_dependencies():
+        # pyvis is only needed for visualization: it is not imported along with the Registry
+        from pyvis.network import Network
+
         g = Network(height="1000px",
                     width="100%",
                     notebook=True,
@@ -1360,13 +1768,13 @@ class Registry:
                     directed=True)
         g.toggle_hide_edges_on_drag(True)
         g.barnes_hut()
-        dag_str = nx.DiGraph()
-        dag_str.update(
-            nodes=[(str(node), node_props) for (node, node_props) in Registry.DEPENDENCY_DAG.nodes(data=True)],
-            edges=[(str(s), str(t)) for (s, t) in Registry.DEPENDENCY_DAG.edges()])
+        # Each node is converted to its string format once, regardless of its number of edges
+        dag_str = nx.relabel_nodes(Registry.DEPENDENCY_DAG,
+                                   {node: str(node) for node in Registry.DEPENDENCY_DAG},
+                                   copy=True)
 
-        for node in dag_str.nodes(data=True):
-            node[1]['title'] = node[1]['variants'] if 'variants' in node[1] else 'No variants'
+        for _, node_props in dag_str.nodes(data=True):
+            node_props['title'] = node_props.get('variants', 'No variants')
 
         g.from_nx(dag_str)
         g.set_options(options="""
@@ -8,7 +8,6 @@ import re
 from typing import Any, Dict
 
 import numpy as np
-import pandas as pd
 
 LINE_WIDTH = 700
 
@@ -111,6 +110,9 @@ def prettify_statistics(
         The input statistics in string format
     """
 
+    # pandas is only needed here: importing it lazily avoids paying its import time on module load
+    import pandas as pd
+
     non_float_columns = [column for column, value in statistics.items() if type(value) in [np.ndarray, list, dict]]
     df = pd.DataFrame([statistics])
 
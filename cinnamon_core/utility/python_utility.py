@@ -1,6 +1,6 @@
 import inspect
 from itertools import product
-from typing import Dict, List
+from typing import Dict, List, Iterator
 
 
 def get_dict_values_combinations(
@@ -17,17 +17,30 @@ def get_dict_values_combinations(
         A list of dictionaries, each describing a parameters combination
     """
 
-    params_combinations = []
+    return list(iterate_dict_values_combinations(params_dict=params_dict))
+
+
+def iterate_dict_values_combinations(
+        params_dict: Dict
+) -> Iterator[Dict]:
+    """
+    Lazily builds parameters combinations (see ``get_dict_values_combinations``).
+
+    Args:
+        params_dict: dictionary that has parameter names as keys and the list of possible values as values
+
+    Returns:
+        An iterator over dictionaries, each describing a parameters combination
+    """
 
     keys = sorted(params_dict)
-    comb_tuples = product(*(params_dict[key] for key in keys))
 
-    for comb_tuple in comb_tuples:
-        instance_params = {dict_key: comb_item for dict_key, comb_item in zip(keys, comb_tuple)}
-        if len(instance_params):
-            params_combinations.append(instance_params)
+    # product() of no iterables yields a single empty combination
+    if not keys:
+        return
 
-    return params_combinations
+    for comb_tuple in product(*(params_dict[key] for key in keys)):
+        yield dict(zip(keys, comb_tuple))
 
 
 # Taken from: https://stackoverflow.com/questions/2521901/get-a-list-tuple-dict-of-the-arguments-passed-to-a-function
@@ -65,4 +78,5 @@ def get_function_signature(
     return arguments.parameters.keys()
 
 
-__all__ = ['get_dict_values_combinations', 'get_function_arguments', 'get_function_signature']
+__all__ = ['get_dict_values_combinations', 'iterate_dict_values_combinations', 'get_function_arguments',
+           'get_function_signature']
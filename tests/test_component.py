@@ -2,6 +2,7 @@ import pytest
 
 from cinnamon_core.core.component import Component
 from cinnamon_core.core.configuration import Configuration
+from cinnamon_core.core.data import FieldDict
 from cinnamon_core.core.registry import Registry
 from pathlib import Path
 
@@ -93,6 +94,27 @@ def test_save_and_load():
     component_path.unlink()
 
 
+def test_save_and_load_field_dict_value(
+        tmp_path
+):
+    """
+    Testing component.save() and component.load() when the configuration stores a ``FieldDict`` value
+    """
+
+    config = Configuration()
+    config.add(name='x', value=5)
+    config.add(name='fields', value=FieldDict(y=10))
+    component = Component(config=config)
+    component.save(serialization_path=tmp_path)
+
+    component.x = 10
+    component.config.fields.y = 20
+
+    component.load(serialization_path=tmp_path)
+    assert component.x == 5
+    assert component.config.fields.y == 10
+
+
 def test_save_and_load_nested():
     """
     Testing component.save() and component.load().
@@ -1,3 +1,4 @@
+import pickle
 from copy import deepcopy
 from typing import List
 
@@ -121,6 +122,125 @@ def test_variants_validation_exception():
         config.validate()
 
 
+def test_condition_added_after_validation(define_configuration):
+    """
+    Testing that conditions added after a validation are evaluated by subsequent validations
+    """
+
+    config = define_configuration
+    assert config.validate(strict=False).passed
+
+    config.add_condition(condition=lambda c: c.x > 10,
+                         name='x_greater_than_10')
+    result = config.validate(strict=False)
+    assert result.passed is False
+    assert result.error_message == 'Condition x_greater_than_10 failed!'
+
+
+def test_conditions_updated_directly(define_configuration):
+    """
+    Testing that conditions added to or removed from ``conditions`` directly are taken into account by validation
+    """
+
+    config = define_configuration
+    assert config.validate(strict=False).passed
+
+    config.conditions['x_greater_than_10'] = lambda c: c.x > 10
+    result = config.validate(strict=False)
+    assert result.passed is False
+    assert result.error_message == 'Condition x_greater_than_10 failed!'
+
+    del config.conditions['x_greater_than_10']
+    assert config.validate(strict=False).passed
+
+    config.conditions = {'always_fails': lambda c: False}
+    result = config.validate(strict=False)
+    assert result.passed is False
+    assert result.error_message == 'Condition always_fails failed!'
+
+
+def test_stage_conditions(define_configuration):
+    """
+    Testing that ``pre`` and ``post`` conditions are only evaluated before and after building, respectively
+    """
+
+    config = define_configuration
+    config.add_condition(condition=lambda c: False, name='post_always_fails')
+    config.add_condition(condition=lambda c: c.x > 0, name='pre_x_positive')
+    assert config.validate(strict=False).passed
+
+    config.built = True
+    result = config.validate(strict=False)
+    assert result.passed is False
+    assert result.error_message == 'Condition post_always_fails failed!'
+
+    config.remove_condition(name='post_always_fails')
+    config.x = -1
+    assert config.validate(strict=False).passed
+
+
+class PostBuildConfig(Configuration):
+
+    def post_build(
+            self
+    ):
+        super().post_build()
+        self.x = 'invalid_integer'
+
+
+def test_fully_validate_after_post_build():
+    """
+    Testing that fully_validate() evaluates all conditions again after post_build() updated parameters
+    """
+
+    config = PostBuildConfig()
+    config.add(name='x',
+               value=10,
+               type_hint=int)
+    assert config.validate().passed
+
+    result = config.fully_validate(strict=False)
+    assert result.passed is False
+    assert result.error_message == 'Condition x_typecheck failed!'
+
+
+def test_readd_parameter_typecheck(define_configuration):
+    """
+    Testing that re-adding a parameter updates its type checking condition
+    """
+
+    config = define_configuration
+    typecheck = config.conditions['x_typecheck']
+    config.add(name='x',
+               value=10,
+               type_hint=int)
+    assert config.conditions['x_typecheck'] is typecheck
+
+    config.add(name='x',
+               value='a string',
+               type_hint=str)
+    assert config.validate(strict=False).passed
+
+    config.add(name='x',
+               value=10)
+    assert 'x_typecheck' not in config.conditions
+
+
+def test_required_conditions_first(define_configuration):
+    """
+    Testing that required parameters are checked before any other condition
+    """
+
+    config = define_configuration
+    config.add(name='y',
+               type_hint=int,
+               is_required=True)
+    config.x = 'invalid_integer'
+    result = config.validate(strict=False)
+    assert result.passed is False
+    assert result.error_message == 'Condition y_is_required failed!'
+
+
 @pytest.fixture
 def register_component():
     Registry.clear()
@@ -249,3 +369,22 @@ def test_get_delta_copy():
     assert 'y' not in config
     assert 'y' not in delta_copy
     assert other_copy.y == 0
+
+
+def test_pickle(define_configuration):
+    """
+    Testing that a ``Configuration`` can be pickled and that its child parameters are restored
+    """
+
+    config = define_configuration
+    config.add(name='child',
+               value=RegistrationKey(name='child', namespace='testing'),
+               is_child=True)
+
+    loaded = pickle.loads(pickle.dumps(config))
+    assert loaded.x == 10
+    assert list(loaded.children) == ['child']
+    assert loaded.validate().passed
+
+    loaded.x = 'invalid_integer'
+    assert not loaded.validate(strict=False).passed
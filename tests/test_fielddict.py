@@ -1,5 +1,8 @@
+import gc
+import pickle
+import weakref
 from copy import deepcopy
-from typing import List
+from typing import List, Dict, Callable
 
 import pytest
 
@@ -92,3 +95,221 @@ def test_copy():
     assert field_dict.y.z == 5
     assert copy.y.z == 10
 
+
+
+def test_search_by_tag():
+    """
+    Testing fielddict.search_by_tag() with exact and partial tags matching
+    """
+
+    field_dict = FieldDict()
+    field_dict.add(name='x',
+                   value=1,
+                   tags={'a'})
+    field_dict.add(name='y',
+                   value=2,
+                   tags={'a', 'b'})
+    field_dict.add(name='z',
+                   value=3)
+
+    assert field_dict.search_by_tag(tags='a') == {'x': 1}
+    assert field_dict.search_by_tag(tags='a', exact_match=False) == {'x': 1, 'y': 2}
+    assert field_dict.search_by_tag(tags={'a', 'b'}, exact_match=False) == {'y': 2}
+    assert field_dict.search_by_tag(tags='c', exact_match=False) == {}
+
+    # Replacing a field updates its tags
+    field_dict.add(name='y',
+                   value=2,
+                   tags={'b'})
+    assert field_dict.search_by_tag(tags='a', exact_match=False) == {'x': 1}
+    assert field_dict.search_by_tag(tags='b') == {'y': 2}
+    assert field_dict.search_by_tag(tags=frozenset({'a'})) == {'x': 1}
+
+
+def test_search_by_tag_after_dict_updates():
+    """
+    Testing that fielddict.search_by_tag() reflects fields updated via dictionary methods
+    """
+
+    field_dict = FieldDict()
+    field_dict.add(name='x',
+                   value=1,
+                   tags={'a'})
+    assert field_dict.search_by_tag(tags='a') == {'x': 1}
+
+    field = field_dict.pop('x')
+    assert field.value == 1
+    assert field_dict.search_by_tag(tags='a') == {}
+
+    field_dict.update({'y': Field(name='y', value=2, tags={'a'})})
+    assert field_dict.search_by_tag(tags='a') == {'y': 2}
+
+    field_dict.clear()
+    assert field_dict.search_by_tag(tags='a') == {}
+
+
+def test_nested_validation():
+    """
+    Testing that fielddict.validate() also validates nested fielddicts
+    """
+
+    nested = FieldDict()
+    nested.add(name='z',
+               value=5,
+               type_hint=int)
+    field_dict = FieldDict()
+    field_dict.add(name='y',
+                   value=nested)
+    field_dict.validate()
+
+    nested.z = 'invalid_integer'
+    with pytest.raises(ValidationFailureException):
+        field_dict.validate()
+
+    other_nested = FieldDict()
+    other_nested.add(name='w',
+                     value='invalid_integer',
+                     type_hint=int)
+    field_dict.y = other_nested
+    with pytest.raises(ValidationFailureException):
+        field_dict.validate()
+
+
+def test_field_hash():
+    """
+    Testing that ``Field`` hashing is consistent with equality and does not depend on the value
+    """
+
+    class Unprintable:
+
+        def __str__(self):
+            raise AssertionError('Field value should not be formatted when hashing')
+
+    field = Field(name='x', value=Unprintable())
+    assert hash(field) == hash('x')
+    assert hash(Field(name='y', value=[1, 2])) == hash(Field(name='y', value=[1, 2]))
+    assert len({Field(name='y', value=5), Field(name='y', value=5)}) == 1
+
+
+def test_field_long_repr():
+    """
+    Testing that ``Field.long_repr()`` reflects metadata and value updates
+    """
+
+    field = Field(name='x', value=[1], description='a field')
+    assert 'description: a field' in field.long_repr()
+
+    field.description = 'an updated field'
+    field.value.append(2)
+    long_repr = field.long_repr()
+    assert 'description: an updated field' in long_repr
+    assert 'value: [1, 2]' in long_repr
+
+
+def test_typecheck_after_in_place_update():
+    """
+    Testing that type checking detects in-place updates of (mutable) values
+    """
+
+    field_dict = FieldDict()
+    field_dict.add(name='x',
+                   value={'a': 1},
+                   type_hint=Dict[str, int])
+    assert field_dict.validate(strict=False).passed
+
+    field_dict.x['b'] = 'invalid_integer'
+    assert not field_dict.validate(strict=False).passed
+
+
+def test_shared_nested_validation():
+    """
+    Testing that fielddict.validate() handles nested fielddicts shared by multiple fields
+    """
+
+    nested = FieldDict()
+    nested.add(name='z',
+               value=5,
+               type_hint=int)
+    field_dict = FieldDict()
+    field_dict.add(name='x',
+                   value=nested)
+    field_dict.add(name='y',
+                   value=nested)
+    nested.add(name='parent',
+               value=field_dict)
+    assert field_dict.validate().passed
+
+
+def test_get_missing_field():
+    """
+    Testing that missing fields are reported as such by ``get``, item and attribute access
+    """
+
+    field_dict = FieldDict()
+    field_dict.add(name='x',
+                   value=1)
+    assert field_dict.get('x').value == 1
+    assert field_dict.get('y') is None
+    assert field_dict.get('y', 'default') == 'default'
+
+    with pytest.raises(KeyError):
+        field_dict['y']
+
+    with pytest.raises(AttributeError):
+        field_dict.y
+
+
+class Model:
+
+    def __call__(
+            self
+    ):
+        pass
+
+
+def test_typecheck_does_not_keep_values_alive():
+    """
+    Testing that type checked values are garbage collected once their ``FieldDict`` is deleted
+    """
+
+    field_dict = FieldDict()
+    field_dict.add(name='model',
+                   value=Model(),
+                   type_hint=Model)
+    field_dict.add(name='callback',
+                   value=Model(),
+                   type_hint=Callable[[], None])
+    assert field_dict.validate(strict=False).passed
+    assert field_dict.validate(strict=False).passed
+
+    model_ref = weakref.ref(field_dict.model)
+    callback_ref = weakref.ref(field_dict.callback)
+    del field_dict
+    gc.collect()
+    assert model_ref() is None
+    assert callback_ref() is None
+
+
+def test_pickle():
+    """
+    Testing that a ``FieldDict`` can be pickled and that its indexes are restored
+    """
+
+    field_dict = FieldDict()
+    field_dict.add(name='x',
+                   value=1,
+                   type_hint=int,
+                   tags={'a'})
+    field_dict.add(name='nested',
+                   value=FieldDict(y=2))
+
+    loaded = pickle.loads(pickle.dumps(field_dict))
+    assert loaded.x == 1
+    assert loaded.nested.y == 2
+    assert loaded.search_by_tag(tags='a') == {'x': 1}
+    assert loaded.validate().passed
+
+    loaded.add(name='z',
+               value=3,
+               tags={'a'})
+    assert loaded.search_by_tag(tags='a') == {'x': 1, 'z': 3}
@@ -5,7 +5,7 @@ import pytest
 
 from cinnamon_core.core.component import Component
 from cinnamon_core.core.configuration import Configuration, C
-from cinnamon_core.core.registry import Registry, RegistrationKey, DisconnectedGraphException
+from cinnamon_core.core.registry import Registry, RegistrationKey, DisconnectedGraphException, NotADAGException
 
 
 @pytest.fixture
@@ -29,6 +29,26 @@ def test_add_configuration(
     assert Registry.check_registration_graph()
 
 
+def test_check_registration_graph_after_changes(
+        reset_registry
+):
+    """
+    Testing that the registration DAG is checked again only after it has been modified
+    """
+
+    Registry.add_configuration(config_class=Configuration,
+                               name='config',
+                               namespace='testing')
+    assert Registry.check_registration_graph()
+    assert not Registry.DEPENDENCY_DAG_CHANGED
+
+    Registry.add_configuration(config_class=Configuration,
+                               name='other_config',
+                               namespace='testing')
+    assert Registry.DEPENDENCY_DAG_CHANGED
+    assert Registry.check_registration_graph()
+
+
 def test_expand_and_resolve_single_configuration(
         reset_registry
 ):
@@ -209,6 +229,27 @@ def test_two_level_add_variants(
     assert len(Registry.REGISTRY) == 36
 
 
+def test_register_variants_twice(
+        reset_registry
+):
+    """
+    Testing that registering the variants of an already expanded configuration returns its variant keys again
+    """
+
+    first_keys = Registry.register_and_bind_variants(config_class=ConfigE,
+                                                     component_class=Component,
+                                                     name='config_e',
+                                                     namespace='testing')
+    assert len(first_keys) == 4
+
+    second_keys = Registry.register_and_bind_variants(config_class=ConfigE,
+                                                      component_class=Component,
+                                                      name='config_e',
+                                                      namespace='testing')
+    assert second_keys == first_keys[1:]
+    assert len(Registry.REGISTRY) == 4
+
+
 class ConfigF(Configuration):
 
     @classmethod
@@ -256,6 +297,26 @@ def test_cycle(
         Registry.check_registration_graph()
 
 
+def test_connected_cycle(
+        reset_registry
+):
+    """
+    Testing that an exception occurs when the registration DAG contains a cycle and no disconnected nodes
+    """
+
+    Registry.add_configuration(config_class=Configuration,
+                               name='config',
+                               namespace='testing')
+    Registry.add_configuration(config_class=ConfigF,
+                               name='config_f',
+                               namespace='testing')
+    Registry.add_configuration(config_class=ConfigG,
+                               name='config_g',
+                               namespace='testing')
+    with pytest.raises(NotADAGException):
+        Registry.check_registration_graph()
+
+
 class ConfigH(Configuration):
 
     @classmethod
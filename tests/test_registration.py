@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 from typing import Type
 
@@ -33,6 +34,21 @@ def test_registration(
     assert config_info.constructor == Configuration.get_default
 
 
+def test_retrieve_configuration_from_string(
+        reset_registry
+):
+    """
+    Testing that a ``Configuration`` can be retrieved via the string format of its ``RegistrationKey``.
+    """
+
+    key = Registry.register_configuration(config_class=Configuration,
+                                          name='test',
+                                          tags={'tag1'},
+                                          namespace='testing')
+    config_info = Registry.retrieve_configurations_from_key(registration_key=str(key))
+    assert config_info is Registry.REGISTRY[key]
+
+
 def test_repeated_registration(
         reset_registry
 ):
@@ -91,11 +107,45 @@ def test_retrieve_multiple_configurations(
     Registry.register_configuration_from_key(config_class=Configuration,
                                              registration_key=key2)
 
+    key3 = RegistrationKey(name='other_config',
+                           tags={'tag1'},
+                           namespace='testing')
+    Registry.register_configuration_from_key(config_class=Configuration,
+                                             registration_key=key3)
+
     retrieved_configs = Registry.retrieve_configurations_from_key(registration_key=key2,
                                                                   exact_match=False)
     assert len(retrieved_configs) == 2
 
 
+def test_retrieve_multiple_configurations_after_registry_updates(
+        reset_registry
+):
+    """
+    Testing registry partial match search when the registry is updated directly
+    """
+
+    key1 = Registry.register_configuration(config_class=Configuration,
+                                           name='test_config',
+                                           tags={'tag1'},
+                                           namespace='testing')
+    key2 = RegistrationKey(name='test_config',
+                           tags={'tag2', 'tag1'},
+                           namespace='testing')
+    Registry.REGISTRY[key2] = Registry.REGISTRY[key1]
+    assert len(Registry.retrieve_configurations_from_key(registration_key=key2,
+                                                         exact_match=False)) == 2
+
+    del Registry.REGISTRY[key1]
+    assert len(Registry.retrieve_configurations_from_key(registration_key=key2,
+                                                         exact_match=False)) == 1
+
+    Registry.REGISTRY.clear()
+    assert Registry.retrieve_configurations_from_key(registration_key=key2,
+                                                     exact_match=False,
+                                                     strict=False) == []
+
+
 def test_register_and_then_binding(
         reset_registry
 ):
@@ -179,6 +229,77 @@ def test_build_component(
     assert type(component) == Component
 
 
+def test_build_component_children(
+        reset_registry
+):
+    """
+    Testing that building a Component also builds its list of child Components
+    """
+
+    child_key = Registry.register_and_bind(config_class=Configuration,
+                                           component_class=Component,
+                                           name='child',
+                                           namespace='testing')
+    config = Configuration()
+    config.add(name='processors',
+               value=[child_key, child_key],
+               is_child=True)
+    config.post_build()
+    assert len(config.processors) == 2
+    assert all(type(processor) == Component for processor in config.processors)
+    assert config.processors[0] is not config.processors[1]
+
+
+def test_build_configuration_copies(
+        reset_registry
+):
+    """
+    Testing that building the same registered configuration twice returns independent instances
+    """
+
+    key = Registry.register_configuration(config_class=Configuration,
+                                          name='config',
+                                          namespace='testing')
+    first = Registry.build_configuration_from_key(registration_key=key)
+    first.add(name='x', value=5)
+    second = Registry.build_configuration_from_key(registration_key=key)
+
+    assert first is not second
+    assert 'x' not in second
+
+
+def test_build_configuration_cacheable(
+        reset_registry
+):
+    """
+    Testing that configuration constructors are called at each build unless registered as cacheable
+    """
+
+    calls = []
+
+    def constructor():
+        calls.append(1)
+        return Configuration.get_default()
+
+    key = Registry.register_configuration(config_class=Configuration,
+                                          config_constructor=constructor,
+                                          name='config',
+                                          namespace='testing')
+    Registry.build_configuration_from_key(registration_key=key)
+    Registry.build_configuration_from_key(registration_key=key)
+    assert len(calls) == 2
+
+    cached_key = Registry.register_configuration(config_class=Configuration,
+                                                 config_constructor=constructor,
+                                                 name='cached_config',
+                                                 namespace='testing',
+                                                 cacheable=True)
+    first = Registry.build_configuration_from_key(registration_key=cached_key)
+    second = Registry.build_configuration_from_key(registration_key=cached_key)
+    assert len(calls) == 3
+    assert first is not second
+
+
 def test_register_built_component(
         reset_registry
 ):
@@ -213,6 +334,34 @@ def test_retrieve_built_component(
     assert component == retrieved
 
 
+def test_retrieve_default_built_component(
+        reset_registry
+):
+    """
+    Testing built component registration and retrieval APIs with the ``default`` tag
+    """
+
+    key = Registry.register_and_bind(config_class=Configuration,
+                                     component_class=Component,
+                                     name='component',
+                                     tags={'tag'},
+                                     namespace='testing',
+                                     is_default=True)
+    assert key.tags == {'tag', 'default'}
+
+    component = Registry.build_component_from_key(registration_key=key)
+    Registry.register_component_instance(component=component,
+                                         name='component',
+                                         tags={'tag'},
+                                         namespace='testing',
+                                         is_default=True)
+    retrieved = Registry.retrieve_component_instance(name='component',
+                                                     tags={'tag'},
+                                                     namespace='testing',
+                                                     is_default=True)
+    assert component == retrieved
+
+
 def test_register_built_component_exception(
         reset_registry
 ):
@@ -243,6 +392,25 @@ def test_retrieve_external_configurations(
     assert isinstance(component, Component)
 
 
+def test_load_registrations_directory_links(
+        reset_registry,
+        tmp_path
+):
+    """
+    Testing that registrations are loaded from hidden folders and that links to directories are not followed.
+    """
+
+    config_folder = tmp_path.joinpath('.hidden', 'configurations')
+    config_folder.mkdir(parents=True)
+    registrations = Path(__file__).parent.joinpath('external_test_repo', 'configurations', 'test.py')
+    config_folder.joinpath('test.py').write_text(registrations.read_text())
+    tmp_path.joinpath('.hidden', 'loop').symlink_to(tmp_path, target_is_directory=True)
+
+    Registry.load_registrations(directory_path=tmp_path)
+    Registry.expand_and_resolve_registration()
+    assert Registry.is_in_registry(registration_key=RegistrationKey(name='test', namespace='external'))
+
+
 class ConfigA(Configuration):
 
     @classmethod
@@ -282,3 +450,69 @@ def test_register_delta_copy(
                                                                                    namespace='testing'))
     assert component.x == 10
     assert component.y == 15
+
+
+def test_registration_key_pickle():
+    """
+    Testing that an unpickled ``RegistrationKey`` matches the original key in ``Registry`` lookups.
+    """
+
+    key = RegistrationKey(name='config', tags={'a', 'b'}, namespace='testing')
+    loaded = pickle.loads(pickle.dumps(key))
+
+    assert loaded == key
+    assert hash(loaded) == hash(key)
+    assert str(loaded) == str(key)
+
+
+def test_registration_key_get():
+    """
+    Testing that ``RegistrationKey.get`` shares instances with equal attributes.
+    """
+
+    key = RegistrationKey.get(name='config', tags={'a', 'b'}, namespace='testing')
+
+    assert RegistrationKey.get(name='config', tags={'b', 'a'}, namespace='testing') is key
+    assert RegistrationKey.get(name='config', namespace='testing') is not key
+    assert key == RegistrationKey(name='config', tags={'a', 'b'}, namespace='testing')
+
+
+def test_registration_key_from_string():
+    """
+    Testing that parsing a ``RegistrationKey`` string format restores the original key.
+    """
+
+    key = RegistrationKey(name='config', tags={'a', 'b'}, namespace='testing')
+    parsed = RegistrationKey.from_string(str(key))
+
+    assert parsed == key
+    assert RegistrationKey.from_string(str(key)) is parsed
+    assert str(key) == 'name:config--tags:["a", "b"]--namespace:testing'
+    assert RegistrationKey.from_string("name:config--tags:['a', 'b']--namespace:testing") == key
+
+
+def test_registration_key_tags():
+    """
+    Testing that ``RegistrationKey`` tags are not affected by changes to the given tags.
+    """
+
+    tags = {'a'}
+    key = RegistrationKey(name='config', tags=tags, namespace='testing')
+    tags.add('b')
+
+    assert key.tags == {'a'}
+    assert key == RegistrationKey(name='config', tags={'a'}, namespace='testing')
+
+
+def test_registration_key_partial_match():
+    """
+    Testing ``RegistrationKey.partial_match`` for keys with and without tags.
+    """
+
+    key = RegistrationKey(name='config', namespace='testing')
+    tagged_key = RegistrationKey(name='config', tags={'a'}, namespace='testing')
+
+    assert key.partial_match(RegistrationKey(name='config', namespace='testing'))
+    assert tagged_key.partial_match(RegistrationKey(name='config', tags={'a', 'b'}, namespace='testing'))
+    assert not key.partial_match(tagged_key)
+    assert not tagged_key.partial_match(RegistrationKey(name='config', tags={'b'}, namespace='testing'))
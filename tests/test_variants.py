@@ -219,3 +219,18 @@ def test_variants_with_conditions(
                                                        name='config_f',
                                                        namespace='testing')
     assert len(variant_keys) == 3
+
+
+def test_variants_combinations_type_mismatch():
+    """
+    Testing that variant values that do not match their parameter type hint are excluded from combinations
+    """
+
+    config = Configuration()
+    config.add(name='param_1', value=1, type_hint=int, variants=[1, 'invalid', 2])
+    config.add(name='param_2', value=True, type_hint=bool, variants=[False, True])
+
+    combinations = config.get_variants_combinations()
+    assert len(combinations) == 4
+    assert all(type(combination['param_1']) == int for combination in combinations)
+    assert config.param_1 == 1